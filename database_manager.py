@@ -7,11 +7,396 @@ backup/restore capabilities, and data synchronization with the core system objec
 
 import sqlite3
 import json
-import shutil
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
 from datetime import datetime
 from typing import List, Tuple, Optional
 from school_management import Student, Instructor, Course, SchoolManagementSystem
 
+logger = logging.getLogger(__name__)
+
+
+# Statements are kept as module constants so every call passes the identical
+# SQL text, which lets sqlite3's per-connection statement cache reuse the
+# compiled statement instead of re-parsing it.
+_SQL_INSERT_STUDENT = "INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_INSTRUCTOR = "INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_COURSE = "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)"
+_SQL_INSERT_REGISTRATION = "INSERT INTO student_course_registrations (student_id, course_id) VALUES (?, ?)"
+
+# Upserts used by sync_system_to_db. The WHERE clause skips rows whose values
+# are unchanged, so they are not rewritten and their triggers do not fire.
+_SQL_UPSERT_STUDENT = '''
+    INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)
+    ON CONFLICT (student_id) DO UPDATE SET
+        name = excluded.name, age = excluded.age, email = excluded.email
+    WHERE name IS NOT excluded.name OR age IS NOT excluded.age OR email IS NOT excluded.email
+'''
+_SQL_UPSERT_INSTRUCTOR = '''
+    INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)
+    ON CONFLICT (instructor_id) DO UPDATE SET
+        name = excluded.name, age = excluded.age, email = excluded.email
+    WHERE name IS NOT excluded.name OR age IS NOT excluded.age OR email IS NOT excluded.email
+'''
+_SQL_UPSERT_COURSE = '''
+    INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)
+    ON CONFLICT (course_id) DO UPDATE SET
+        course_name = excluded.course_name, instructor_id = excluded.instructor_id
+    WHERE course_name IS NOT excluded.course_name OR instructor_id IS NOT excluded.instructor_id
+'''
+_SQL_UPSERT_REGISTRATION = '''
+    INSERT INTO student_course_registrations (student_id, course_id) VALUES (?, ?)
+    ON CONFLICT (student_id, course_id) DO NOTHING
+'''
+
+_SQL_SELECT_STUDENT_IDS = "SELECT student_id FROM students"
+_SQL_SELECT_INSTRUCTOR_IDS = "SELECT instructor_id FROM instructors"
+_SQL_SELECT_COURSE_IDS = "SELECT course_id FROM courses"
+_SQL_SELECT_REGISTRATION_IDS = "SELECT student_id, course_id FROM student_course_registrations"
+
+_SQL_SELECT_STUDENTS = "SELECT student_id, name, age, email FROM students ORDER BY name"
+_SQL_SELECT_INSTRUCTORS = "SELECT instructor_id, name, age, email FROM instructors ORDER BY name"
+_SQL_SELECT_COURSES = '''
+    SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
+    FROM courses c
+    LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    ORDER BY c.course_name
+'''
+_SQL_SELECT_STUDENT_COURSES = '''
+    SELECT c.course_id, c.course_name
+    FROM courses c
+    JOIN student_course_registrations scr ON c.course_id = scr.course_id
+    WHERE scr.student_id = ?
+    ORDER BY c.course_name
+'''
+_SQL_SELECT_COURSE_STUDENTS = '''
+    SELECT s.student_id, s.name
+    FROM students s
+    JOIN student_course_registrations scr ON s.student_id = scr.student_id
+    WHERE scr.course_id = ?
+    ORDER BY s.name
+'''
+_SQL_SELECT_REGISTRATIONS = '''
+    SELECT scr.student_id, scr.course_id
+    FROM student_course_registrations scr
+    JOIN courses c ON c.course_id = scr.course_id
+    ORDER BY c.course_name
+'''
+_SQL_SELECT_INSTRUCTOR_COURSES = '''
+    SELECT course_id, course_name
+    FROM courses
+    WHERE instructor_id = ?
+    ORDER BY course_name
+'''
+
+# All statistics come back from one statement. Each row is tagged with its
+# kind: one 'counts' row with the four table counts, then the 'popular'
+# courses, then 'unenrolled' courses. The top courses are ranked from the
+# registrations alone (an index-only scan of idx_scr_course) and only the
+# winners are joined to courses. Courses without registrations fill the
+# remaining slots, the way the old LEFT JOIN did; their LIMIT is 0 when the
+# top list is already full, so that part costs nothing then.
+_POPULAR_COURSES_LIMIT = 5
+_SQL_STATISTICS = '''
+    WITH top_courses AS (
+        SELECT course_id, COUNT(*) as enrollment_count
+        FROM student_course_registrations
+        GROUP BY course_id
+        ORDER BY enrollment_count DESC
+        LIMIT :limit
+    )
+    SELECT 'counts', (SELECT COUNT(*) FROM students), (SELECT COUNT(*) FROM instructors),
+           (SELECT COUNT(*) FROM courses), (SELECT COUNT(*) FROM student_course_registrations)
+    UNION ALL
+    SELECT 'popular', c.course_name, t.enrollment_count, NULL, NULL
+    FROM top_courses t
+    JOIN courses c ON c.course_id = t.course_id
+    UNION ALL
+    SELECT 'unenrolled', course_name, 0, NULL, NULL
+    FROM (
+        SELECT c.course_name
+        FROM courses c
+        WHERE NOT EXISTS (
+            SELECT 1 FROM student_course_registrations scr WHERE scr.course_id = c.course_id
+        )
+        LIMIT max(0, :limit - (SELECT COUNT(*) FROM top_courses))
+    )
+'''
+
+# Export queries by table name. The registrations export is driven by a scan
+# of student_course_registrations in rowid order, with one primary-key probe
+# into students and courses per row, so it needs no sort or temp b-tree.
+_SQL_EXPORT = {
+    'students': "SELECT * FROM students",
+    'instructors': "SELECT * FROM instructors",
+    'courses': '''
+        SELECT c.*, i.name as instructor_name
+        FROM courses c
+        LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    ''',
+    'registrations': '''
+        SELECT scr.*, s.name as student_name, c.course_name
+        FROM student_course_registrations scr
+        JOIN students s ON scr.student_id = s.student_id
+        JOIN courses c ON scr.course_id = c.course_id
+        ORDER BY scr.id
+    ''',
+}
+
+_SQL_DELETE_STUDENT = "DELETE FROM students WHERE student_id = ?"
+_SQL_DELETE_INSTRUCTOR = "DELETE FROM instructors WHERE instructor_id = ?"
+_SQL_DELETE_COURSE = "DELETE FROM courses WHERE course_id = ?"
+_SQL_DELETE_REGISTRATION = "DELETE FROM student_course_registrations WHERE student_id = ? AND course_id = ?"
+
+_SQL_SEARCH_STUDENTS = '''
+    SELECT student_id, name, age, email
+    FROM students
+    WHERE name LIKE ? OR student_id LIKE ? OR email LIKE ?
+    ORDER BY name
+'''
+_SQL_SEARCH_STUDENTS_BY_NAME_PREFIX = '''
+    SELECT student_id, name, age, email
+    FROM students
+    WHERE name LIKE ? ESCAPE '\\'
+    ORDER BY name
+'''
+_SQL_SEARCH_INSTRUCTORS = '''
+    SELECT instructor_id, name, age, email
+    FROM instructors
+    WHERE name LIKE ? OR instructor_id LIKE ? OR email LIKE ?
+    ORDER BY name
+'''
+_SQL_SEARCH_INSTRUCTORS_BY_NAME_PREFIX = '''
+    SELECT instructor_id, name, age, email
+    FROM instructors
+    WHERE name LIKE ? ESCAPE '\\'
+    ORDER BY name
+'''
+_SQL_SEARCH_COURSES = '''
+    SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
+    FROM courses c
+    LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    WHERE c.course_name LIKE ? OR c.course_id LIKE ?
+    ORDER BY c.course_name
+'''
+_SQL_SEARCH_COURSES_BY_NAME_PREFIX = '''
+    SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
+    FROM courses c
+    LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    WHERE c.course_name LIKE ? ESCAPE '\\'
+    ORDER BY c.course_name
+'''
+
+# Full-text search uses FTS5's trigram tokenizer, which indexes every
+# three-character sequence case-insensitively. A quoted phrase query then
+# matches exactly the rows a ``LIKE '%term%'`` scan would, but is answered
+# from the inverted index instead of reading every row.
+_SQL_SEARCH_STUDENTS_FTS = '''
+    SELECT s.student_id, s.name, s.age, s.email
+    FROM students s
+    JOIN students_fts f ON f.rowid = s.rowid
+    WHERE students_fts MATCH ?
+    ORDER BY s.name
+'''
+_SQL_SEARCH_INSTRUCTORS_FTS = '''
+    SELECT i.instructor_id, i.name, i.age, i.email
+    FROM instructors i
+    JOIN instructors_fts f ON f.rowid = i.rowid
+    WHERE instructors_fts MATCH ?
+    ORDER BY i.name
+'''
+_SQL_SEARCH_COURSES_FTS = '''
+    SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
+    FROM courses c
+    JOIN courses_fts f ON f.rowid = c.rowid
+    LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    WHERE courses_fts MATCH ?
+    ORDER BY c.course_name
+'''
+
+# Bump whenever _SQL_SCHEMA changes; init_database skips the DDL when the
+# database file already reports this version in PRAGMA user_version.
+_SCHEMA_VERSION = 1
+
+_SQL_SCHEMA = f'''
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL CHECK(age >= 0),
+    email TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS instructors (
+    instructor_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL CHECK(age >= 0),
+    email TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS courses (
+    course_id TEXT PRIMARY KEY,
+    course_name TEXT NOT NULL,
+    instructor_id TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (instructor_id) REFERENCES instructors (instructor_id)
+        ON DELETE SET NULL ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS student_course_registrations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (student_id) REFERENCES students (student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY (course_id) REFERENCES courses (course_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+    UNIQUE(student_id, course_id)
+);
+
+CREATE TRIGGER IF NOT EXISTS update_students_timestamp
+AFTER UPDATE ON students
+BEGIN
+    UPDATE students SET updated_at = CURRENT_TIMESTAMP WHERE student_id = NEW.student_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_instructors_timestamp
+AFTER UPDATE ON instructors
+BEGIN
+    UPDATE instructors SET updated_at = CURRENT_TIMESTAMP WHERE instructor_id = NEW.instructor_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_courses_timestamp
+AFTER UPDATE ON courses
+BEGIN
+    UPDATE courses SET updated_at = CURRENT_TIMESTAMP WHERE course_id = NEW.course_id;
+END;
+
+CREATE INDEX IF NOT EXISTS idx_courses_instructor
+ON courses (instructor_id);
+
+CREATE INDEX IF NOT EXISTS idx_scr_course
+ON student_course_registrations (course_id, student_id);
+
+CREATE INDEX IF NOT EXISTS idx_students_name_nocase
+ON students (name COLLATE NOCASE);
+
+CREATE INDEX IF NOT EXISTS idx_instructors_name_nocase
+ON instructors (name COLLATE NOCASE);
+
+CREATE INDEX IF NOT EXISTS idx_courses_name_nocase
+ON courses (course_name COLLATE NOCASE);
+
+-- Gather planner statistics for the indexes above once, when the schema is
+-- created or upgraded; PRAGMA optimize on close keeps them current after.
+ANALYZE;
+
+PRAGMA user_version = {_SCHEMA_VERSION};
+COMMIT;
+'''
+
+# (table, index table, indexed columns) for the external-content FTS5 tables.
+_FTS_TABLES = (
+    ("students", "students_fts", ("student_id", "name", "email")),
+    ("instructors", "instructors_fts", ("instructor_id", "name", "email")),
+    ("courses", "courses_fts", ("course_id", "course_name")),
+)
+
+# Trigram queries cannot match terms shorter than one trigram.
+_FTS_MIN_TERM_LENGTH = 3
+
+# Pages copied per step of the online backup.
+_BACKUP_PAGES_PER_STEP = 64
+
+# Seconds a get_database_statistics result is reused while nothing has been
+# written through this manager.
+_STATS_TTL = 5.0
+
+# Write buffer for CSV exports, so rows reach the file in large chunks.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _fts_schema(table: str, fts_table: str, columns: Tuple[str, ...]) -> str:
+    """Build the DDL for one FTS5 index and the triggers that keep it in sync.
+    
+    Follows SQLite's external-content pattern: the index stores no copy of
+    the text and is updated from AFTER INSERT/UPDATE/DELETE triggers.
+    """
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    return f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+            {column_list}, content='{table}', content_rowid='rowid', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.rowid, {new_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list})
+            VALUES ('delete', old.rowid, {old_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {table} BEGIN
+            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list})
+            VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.rowid, {new_values});
+        END;
+    '''
+
+
+def _update_statements(table: str, key_column: str, columns: Tuple[str, ...]) -> Tuple[Optional[str], ...]:
+    """Build the UPDATE statement for every combination of changed columns.
+    
+    Entry ``mask`` sets the columns whose bit is set in ``mask`` (bit 0 is the
+    first column); entry 0 is None since there is nothing to update.
+    """
+    statements = [None]
+    for mask in range(1, 1 << len(columns)):
+        assignments = ", ".join(f"{column} = ?" for bit, column in enumerate(columns) if mask >> bit & 1)
+        statements.append(f"UPDATE {table} SET {assignments} WHERE {key_column} = ?")
+    return tuple(statements)
+
+
+_SQL_UPDATE_STUDENT = _update_statements("students", "student_id", ("name", "age", "email"))
+_SQL_UPDATE_INSTRUCTOR = _update_statements("instructors", "instructor_id", ("name", "age", "email"))
+_SQL_UPDATE_COURSE = _update_statements("courses", "course_id", ("course_name", "instructor_id"))
+
+
+def _db_write(action: str):
+    """Log and swallow database errors raised by a write method.
+    
+    The wrapped method returns False instead of raising. Constraint violations
+    are logged as errors; anything else is logged with its traceback.
+    
+    :param action: Completes the log message, e.g. ``"adding student"``
+    :type action: str
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except sqlite3.IntegrityError as e:
+                logger.error("Error %s: %s", action, e)
+                return False
+            except Exception as e:
+                logger.exception("Unexpected error %s: %s", action, e)
+                return False
+        return wrapper
+    return decorator
+
 
 class DatabaseManager:
     """Database manager class for the school management system.
@@ -25,12 +410,123 @@ class DatabaseManager:
     
     :ivar db_path: Path to the database file
     :vartype db_path: str
+    
+    A single connection is opened on construction and shared by every method;
+    access to it is serialized with a lock so the manager can be used from
+    worker threads. Call :meth:`close` when the manager is no longer needed.
+    
+    .. note::
+       The database is switched to WAL journal mode, so ``<db>-wal`` and
+       ``<db>-shm`` files will appear next to the database file while it is open.
     """
     
     def __init__(self, db_path: str = "school_management.db"):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        # WAL is persistent (stored in the database header), so this only
+        # needs to happen once per database file.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._stats_cache = None
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied.
+        
+        The connection is opened in autocommit mode (``isolation_level=None``)
+        so that multi-statement work is grouped explicitly with
+        :meth:`_transaction`. Rows are returned as :class:`sqlite3.Row`, which
+        supports both positional and by-column-name access. Foreign keys are off
+        by default in SQLite, which would silently disable the CASCADE and SET
+        NULL rules declared in the schema. Memory-mapped I/O lets reads come
+        straight from the OS page cache instead of being copied into SQLite's
+        own cache; SQLite clamps the requested size to what the build and
+        platform support.
+        
+        :return: A configured connection to the database file
+        :rtype: sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block of statements as a single transaction.
+        
+        Holds the connection lock for the duration of the block, commits on
+        success and rolls back if the block raises. The transaction is started
+        with ``BEGIN IMMEDIATE`` so the write lock is taken up front instead of
+        being upgraded from a read lock on the first write.
+        
+        :return: A cursor on the shared connection
+        :rtype: sqlite3.Cursor
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+    
+    def _execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        """Execute one statement on the shared connection.
+        
+        :param sql: One of the module-level SQL constants
+        :type sql: str
+        :param params: Parameters bound to the statement
+        :type params: tuple, optional
+        :return: The cursor the statement was executed on
+        :rtype: sqlite3.Cursor
+        """
+        with self._lock:
+            return self._conn.execute(sql, params)
+    
+    def _fetchall(self, sql: str, params=()) -> List[sqlite3.Row]:
+        """Execute a query on the shared connection and fetch every row.
+        
+        :param sql: One of the module-level SQL constants
+        :type sql: str
+        :param params: Parameters bound to the statement
+        :type params: tuple, optional
+        :return: All result rows
+        :rtype: List[sqlite3.Row]
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    def close(self):
+        """Close the underlying database connection.
+        
+        Runs ``PRAGMA optimize`` first so SQLite can refresh the query planner
+        statistics for tables whose usage warrants it. The manager must not be
+        used after it has been closed.
+        """
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            self._conn = None
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning("PRAGMA optimize failed: %s", e)
+            finally:
+                conn.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def init_database(self):
         """Initialize the database with all required tables and triggers.
         
@@ -40,86 +536,75 @@ class DatabaseManager:
         - Courses table with foreign key relationships
         - Student-course registration junction table
         - Automatic timestamp update triggers
+        - Indexes for instructor/course lookups and name prefix search
+        - FTS5 full-text indexes used by the search methods
         
-        All tables include created_at and updated_at timestamp fields.
+        All tables include created_at and updated_at timestamp fields. The schema
+        is only (re)applied when ``PRAGMA user_version`` is older than
+        ``_SCHEMA_VERSION``, so opening an up-to-date database runs no DDL.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS students (
-                    student_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    age INTEGER NOT NULL CHECK(age >= 0),
-                    email TEXT NOT NULL UNIQUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS instructors (
-                    instructor_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    age INTEGER NOT NULL CHECK(age >= 0),
-                    email TEXT NOT NULL UNIQUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS courses (
-                    course_id TEXT PRIMARY KEY,
-                    course_name TEXT NOT NULL,
-                    instructor_id TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (instructor_id) REFERENCES instructors (instructor_id)
-                        ON DELETE SET NULL ON UPDATE CASCADE
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS student_course_registrations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    course_id TEXT NOT NULL,
-                    registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students (student_id)
-                        ON DELETE CASCADE ON UPDATE CASCADE,
-                    FOREIGN KEY (course_id) REFERENCES courses (course_id)
-                        ON DELETE CASCADE ON UPDATE CASCADE,
-                    UNIQUE(student_id, course_id)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_students_timestamp 
-                AFTER UPDATE ON students
-                BEGIN
-                    UPDATE students SET updated_at = CURRENT_TIMESTAMP WHERE student_id = NEW.student_id;
-                END;
-            ''')
-            
-            cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_instructors_timestamp 
-                AFTER UPDATE ON instructors
-                BEGIN
-                    UPDATE instructors SET updated_at = CURRENT_TIMESTAMP WHERE instructor_id = NEW.instructor_id;
-                END;
-            ''')
-            
-            cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_courses_timestamp 
-                AFTER UPDATE ON courses
-                BEGIN
-                    UPDATE courses SET updated_at = CURRENT_TIMESTAMP WHERE course_id = NEW.course_id;
-                END;
-            ''')
-            
-            conn.commit()
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < _SCHEMA_VERSION:
+                self._conn.executescript(_SQL_SCHEMA)
+        
+        self._fts_enabled = self._init_search_index()
+    
+    def _init_search_index(self) -> bool:
+        """Create the FTS5 search tables and their sync triggers.
+        
+        Newly created indexes are rebuilt from the existing rows. If the SQLite
+        library was built without FTS5, searching falls back to LIKE scans.
+        
+        :return: True if full-text search is available, False otherwise
+        :rtype: bool
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            for table, fts_table, columns in _FTS_TABLES:
+                exists = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts_table,)
+                ).fetchone()
+                if exists:
+                    continue
+                try:
+                    cursor.executescript(_fts_schema(table, fts_table, columns))
+                except sqlite3.OperationalError as e:
+                    logger.warning("Full-text search unavailable: %s", e)
+                    return False
+                cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+        return True
+    
+    def _fts_query(self, search_term: str) -> Optional[str]:
+        """Turn a search term into an FTS5 phrase query.
+        
+        :param search_term: The raw term entered by the user
+        :type search_term: str
+        :return: The quoted MATCH expression, or None if the term must be
+                 searched with a LIKE scan instead
+        :rtype: str or None
+        """
+        if not self._fts_enabled or len(search_term) < _FTS_MIN_TERM_LENGTH:
+            return None
+        return '"' + search_term.replace('"', '""') + '"'
+    
+    @staticmethod
+    def _like_prefix(search_term: str) -> str:
+        """Turn a search term into a LIKE pattern for names starting with it.
+        
+        ``\\``, ``%`` and ``_`` in the term are escaped, so they match literally
+        in the ``ESCAPE '\\'`` prefix queries. The pattern has no leading
+        wildcard, so SQLite answers it from the NOCASE name index.
+        
+        :param search_term: The raw term entered by the user
+        :type search_term: str
+        :return: The escaped pattern ending in ``%``
+        :rtype: str
+        """
+        escaped = search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return escaped + '%'
     
+    @_db_write("adding student")
     def add_student(self, student: Student) -> bool:
         """Add a new student to the database.
         
@@ -131,22 +616,10 @@ class DatabaseManager:
         :return: True if student was added successfully, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO students (student_id, name, age, email)
-                    VALUES (?, ?, ?, ?)
-                ''', (student.student_id, student.name, student.age, student.get_email()))
-                conn.commit()
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding student: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error adding student: {e}")
-            return False
+        self._execute(_SQL_INSERT_STUDENT, (student.student_id, student.name, student.age, student.get_email()))
+        return True
     
+    @_db_write("adding instructor")
     def add_instructor(self, instructor: Instructor) -> bool:
         """Add a new instructor to the database.
         
@@ -158,22 +631,10 @@ class DatabaseManager:
         :return: True if instructor was added successfully, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO instructors (instructor_id, name, age, email)
-                    VALUES (?, ?, ?, ?)
-                ''', (instructor.instructor_id, instructor.name, instructor.age, instructor.get_email()))
-                conn.commit()
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding instructor: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error adding instructor: {e}")
-            return False
+        self._execute(_SQL_INSERT_INSTRUCTOR, (instructor.instructor_id, instructor.name, instructor.age, instructor.get_email()))
+        return True
     
+    @_db_write("adding course")
     def add_course(self, course: Course) -> bool:
         """Add a new course to the database.
         
@@ -185,23 +646,11 @@ class DatabaseManager:
         :return: True if course was added successfully, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                instructor_id = course.instructor.instructor_id if course.instructor else None
-                cursor.execute('''
-                    INSERT INTO courses (course_id, course_name, instructor_id)
-                    VALUES (?, ?, ?)
-                ''', (course.course_id, course.course_name, instructor_id))
-                conn.commit()
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding course: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error adding course: {e}")
-            return False
+        instructor_id = course.instructor.instructor_id if course.instructor else None
+        self._execute(_SQL_INSERT_COURSE, (course.course_id, course.course_name, instructor_id))
+        return True
     
+    @_db_write("registering student to course")
     def register_student_to_course(self, student_id: str, course_id: str) -> bool:
         """Register a student for a course in the database.
         
@@ -215,127 +664,70 @@ class DatabaseManager:
         :return: True if registration was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO student_course_registrations (student_id, course_id)
-                    VALUES (?, ?)
-                ''', (student_id, course_id))
-                conn.commit()
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error registering student to course: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error registering student to course: {e}")
-            return False
+        self._execute(_SQL_INSERT_REGISTRATION, (student_id, course_id))
+        return True
     
-    def get_all_students(self) -> List[Tuple]:
+    def get_all_students(self) -> List[sqlite3.Row]:
         """Retrieve all students from the database.
         
-        :return: List of tuples containing (student_id, name, age, email)
-        :rtype: List[Tuple]
+        :return: List of rows containing (student_id, name, age, email)
+        :rtype: List[sqlite3.Row]
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT student_id, name, age, email FROM students
-                ORDER BY name
-            ''')
-            return cursor.fetchall()
+        return self._fetchall(_SQL_SELECT_STUDENTS)
     
-    def get_all_instructors(self) -> List[Tuple]:
+    def get_all_instructors(self) -> List[sqlite3.Row]:
         """Retrieve all instructors from the database.
         
-        :return: List of tuples containing (instructor_id, name, age, email)
-        :rtype: List[Tuple]
+        :return: List of rows containing (instructor_id, name, age, email)
+        :rtype: List[sqlite3.Row]
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT instructor_id, name, age, email FROM instructors
-                ORDER BY name
-            ''')
-            return cursor.fetchall()
+        return self._fetchall(_SQL_SELECT_INSTRUCTORS)
     
-    def get_all_courses(self) -> List[Tuple]:
+    def get_all_courses(self) -> List[sqlite3.Row]:
         """Retrieve all courses with instructor information from the database.
         
-        :return: List of tuples containing (course_id, course_name, instructor_id, instructor_name)
-        :rtype: List[Tuple]
+        :return: List of rows containing (course_id, course_name, instructor_id, instructor_name)
+        :rtype: List[sqlite3.Row]
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
-                FROM courses c
-                LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-                ORDER BY c.course_name
-            ''')
-            return cursor.fetchall()
+        return self._fetchall(_SQL_SELECT_COURSES)
     
-    def get_student_courses(self, student_id: str) -> List[Tuple]:
+    def get_student_courses(self, student_id: str) -> List[sqlite3.Row]:
         """Get all courses registered by a specific student.
         
         :param student_id: The ID of the student
         :type student_id: str
-        :return: List of tuples containing (course_id, course_name)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT c.course_id, c.course_name
-                FROM courses c
-                JOIN student_course_registrations scr ON c.course_id = scr.course_id
-                WHERE scr.student_id = ?
-                ORDER BY c.course_name
-            ''', (student_id,))
-            return cursor.fetchall()
-    
-    def get_course_students(self, course_id: str) -> List[Tuple]:
+        :return: List of rows containing (course_id, course_name)
+        :rtype: List[sqlite3.Row]
+        """
+        return self._fetchall(_SQL_SELECT_STUDENT_COURSES, (student_id,))
+    
+    def get_course_students(self, course_id: str) -> List[sqlite3.Row]:
         """Get all students enrolled in a specific course.
         
         :param course_id: The ID of the course
         :type course_id: str
-        :return: List of tuples containing (student_id, name)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT s.student_id, s.name
-                FROM students s
-                JOIN student_course_registrations scr ON s.student_id = scr.student_id
-                WHERE scr.course_id = ?
-                ORDER BY s.name
-            ''', (course_id,))
-            return cursor.fetchall()
-    
-    def get_instructor_courses(self, instructor_id: str) -> List[Tuple]:
+        :return: List of rows containing (student_id, name)
+        :rtype: List[sqlite3.Row]
+        """
+        return self._fetchall(_SQL_SELECT_COURSE_STUDENTS, (course_id,))
+    
+    def get_instructor_courses(self, instructor_id: str) -> List[sqlite3.Row]:
         """Get all courses assigned to a specific instructor.
         
         :param instructor_id: The ID of the instructor
         :type instructor_id: str
-        :return: List of tuples containing (course_id, course_name)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT course_id, course_name
-                FROM courses
-                WHERE instructor_id = ?
-                ORDER BY course_name
-            ''', (instructor_id,))
-            return cursor.fetchall()
+        :return: List of rows containing (course_id, course_name)
+        :rtype: List[sqlite3.Row]
+        """
+        return self._fetchall(_SQL_SELECT_INSTRUCTOR_COURSES, (instructor_id,))
     
+    @_db_write("updating student")
     def update_student(self, student_id: str, name: str = None, age: int = None, email: str = None) -> bool:
         """Update student information in the database.
         
         Updates only the specified fields, leaving others unchanged.
-        Automatically updates the updated_at timestamp.
+        Automatically updates the updated_at timestamp. A call with no fields
+        to change returns True without touching the database.
         
         :param student_id: The ID of the student to update
         :type student_id: str
@@ -348,44 +740,22 @@ class DatabaseManager:
         :return: True if update was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                updates = []
-                params = []
-                
-                if name is not None:
-                    updates.append("name = ?")
-                    params.append(name)
-                if age is not None:
-                    updates.append("age = ?")
-                    params.append(age)
-                if email is not None:
-                    updates.append("email = ?")
-                    params.append(email)
-                
-                if updates:
-                    params.append(student_id)
-                    cursor.execute(f'''
-                        UPDATE students SET {", ".join(updates)}
-                        WHERE student_id = ?
-                    ''', params)
-                    conn.commit()
-                    return cursor.rowcount > 0
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating student: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error updating student: {e}")
-            return False
+        if name is None and age is None and email is None:
+            return True
+        
+        mask = (name is not None) | (age is not None) << 1 | (email is not None) << 2
+        params = [value for value in (name, age, email) if value is not None]
+        params.append(student_id)
+        cursor = self._execute(_SQL_UPDATE_STUDENT[mask], params)
+        return cursor.rowcount > 0
     
+    @_db_write("updating instructor")
     def update_instructor(self, instructor_id: str, name: str = None, age: int = None, email: str = None) -> bool:
         """Update instructor information in the database.
         
         Updates only the specified fields, leaving others unchanged.
-        Automatically updates the updated_at timestamp.
+        Automatically updates the updated_at timestamp. A call with no fields
+        to change returns True without touching the database.
         
         :param instructor_id: The ID of the instructor to update
         :type instructor_id: str
@@ -398,44 +768,22 @@ class DatabaseManager:
         :return: True if update was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                updates = []
-                params = []
-                
-                if name is not None:
-                    updates.append("name = ?")
-                    params.append(name)
-                if age is not None:
-                    updates.append("age = ?")
-                    params.append(age)
-                if email is not None:
-                    updates.append("email = ?")
-                    params.append(email)
-                
-                if updates:
-                    params.append(instructor_id)
-                    cursor.execute(f'''
-                        UPDATE instructors SET {", ".join(updates)}
-                        WHERE instructor_id = ?
-                    ''', params)
-                    conn.commit()
-                    return cursor.rowcount > 0
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating instructor: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error updating instructor: {e}")
-            return False
+        if name is None and age is None and email is None:
+            return True
+        
+        mask = (name is not None) | (age is not None) << 1 | (email is not None) << 2
+        params = [value for value in (name, age, email) if value is not None]
+        params.append(instructor_id)
+        cursor = self._execute(_SQL_UPDATE_INSTRUCTOR[mask], params)
+        return cursor.rowcount > 0
     
+    @_db_write("updating course")
     def update_course(self, course_id: str, course_name: str = None, instructor_id: str = None) -> bool:
         """Update course information in the database.
         
         Updates only the specified fields, leaving others unchanged.
-        Automatically updates the updated_at timestamp.
+        Automatically updates the updated_at timestamp. A call with no fields
+        to change returns True without touching the database.
         
         :param course_id: The ID of the course to update
         :type course_id: str
@@ -446,36 +794,16 @@ class DatabaseManager:
         :return: True if update was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                updates = []
-                params = []
-                
-                if course_name is not None:
-                    updates.append("course_name = ?")
-                    params.append(course_name)
-                if instructor_id is not None:
-                    updates.append("instructor_id = ?")
-                    params.append(instructor_id)
-                
-                if updates:
-                    params.append(course_id)
-                    cursor.execute(f'''
-                        UPDATE courses SET {", ".join(updates)}
-                        WHERE course_id = ?
-                    ''', params)
-                    conn.commit()
-                    return cursor.rowcount > 0
-                return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating course: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error updating course: {e}")
-            return False
+        if course_name is None and instructor_id is None:
+            return True
+        
+        mask = (course_name is not None) | (instructor_id is not None) << 1
+        params = [value for value in (course_name, instructor_id) if value is not None]
+        params.append(course_id)
+        cursor = self._execute(_SQL_UPDATE_COURSE[mask], params)
+        return cursor.rowcount > 0
     
+    @_db_write("deleting student")
     def delete_student(self, student_id: str) -> bool:
         """Delete a student from the database.
         
@@ -487,16 +815,10 @@ class DatabaseManager:
         :return: True if deletion was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
-                conn.commit()
-                return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting student: {e}")
-            return False
+        cursor = self._execute(_SQL_DELETE_STUDENT, (student_id,))
+        return cursor.rowcount > 0
     
+    @_db_write("deleting instructor")
     def delete_instructor(self, instructor_id: str) -> bool:
         """Delete an instructor from the database.
         
@@ -508,16 +830,10 @@ class DatabaseManager:
         :return: True if deletion was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM instructors WHERE instructor_id = ?", (instructor_id,))
-                conn.commit()
-                return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting instructor: {e}")
-            return False
+        cursor = self._execute(_SQL_DELETE_INSTRUCTOR, (instructor_id,))
+        return cursor.rowcount > 0
     
+    @_db_write("deleting course")
     def delete_course(self, course_id: str) -> bool:
         """Delete a course from the database.
         
@@ -529,16 +845,72 @@ class DatabaseManager:
         :return: True if deletion was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
-                conn.commit()
-                return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting course: {e}")
-            return False
+        cursor = self._execute(_SQL_DELETE_COURSE, (course_id,))
+        return cursor.rowcount > 0
+    
+    @_db_write("deleting students")
+    def delete_students(self, student_ids: List[str]) -> List[str]:
+        """Delete several students in a single transaction.
+        
+        IDs that match no row are skipped, so callers can tell exactly which
+        students are gone.
+        
+        :param student_ids: The IDs of the students to delete
+        :type student_ids: List[str]
+        :return: The IDs that were deleted, in the given order; empty if none
+                 were, False if the transaction failed
+        :rtype: List[str]
+        """
+        return self._delete_each(_SQL_DELETE_STUDENT, student_ids)
+    
+    @_db_write("deleting instructors")
+    def delete_instructors(self, instructor_ids: List[str]) -> List[str]:
+        """Delete several instructors in a single transaction.
+        
+        IDs that match no row are skipped, so callers can tell exactly which
+        instructors are gone.
+        
+        :param instructor_ids: The IDs of the instructors to delete
+        :type instructor_ids: List[str]
+        :return: The IDs that were deleted, in the given order; empty if none
+                 were, False if the transaction failed
+        :rtype: List[str]
+        """
+        return self._delete_each(_SQL_DELETE_INSTRUCTOR, instructor_ids)
+    
+    @_db_write("deleting courses")
+    def delete_courses(self, course_ids: List[str]) -> List[str]:
+        """Delete several courses in a single transaction.
+        
+        IDs that match no row are skipped, so callers can tell exactly which
+        courses are gone.
+        
+        :param course_ids: The IDs of the courses to delete
+        :type course_ids: List[str]
+        :return: The IDs that were deleted, in the given order; empty if none
+                 were, False if the transaction failed
+        :rtype: List[str]
+        """
+        return self._delete_each(_SQL_DELETE_COURSE, course_ids)
+    
+    def _delete_each(self, sql: str, ids: List[str]) -> List[str]:
+        """Run a single-row delete for each ID inside one transaction.
+        
+        :param sql: One of the ``_SQL_DELETE_*`` statements
+        :type sql: str
+        :param ids: The primary keys to delete
+        :type ids: List[str]
+        :return: The IDs whose row was deleted
+        :rtype: List[str]
+        """
+        deleted = []
+        with self._transaction() as cursor:
+            for record_id in ids:
+                if cursor.execute(sql, (record_id,)).rowcount > 0:
+                    deleted.append(record_id)
+        return deleted
     
+    @_db_write("unregistering student from course")
     def unregister_student_from_course(self, student_id: str, course_id: str) -> bool:
         """Unregister a student from a specific course.
         
@@ -551,82 +923,77 @@ class DatabaseManager:
         :return: True if unregistration was successful, False otherwise
         :rtype: bool
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    DELETE FROM student_course_registrations 
-                    WHERE student_id = ? AND course_id = ?
-                ''', (student_id, course_id))
-                conn.commit()
-                return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error unregistering student from course: {e}")
-            return False
+        cursor = self._execute(_SQL_DELETE_REGISTRATION, (student_id, course_id))
+        return cursor.rowcount > 0
     
-    def search_students(self, search_term: str) -> List[Tuple]:
+    def search_students(self, search_term: str, prefix: bool = False) -> List[sqlite3.Row]:
         """Search for students by name, ID, or email.
         
         Performs case-insensitive partial matching across all searchable fields.
+        Terms of three or more characters are answered from the full-text index.
+        With ``prefix`` set, only names starting with the term are matched, which
+        is answered from the name index instead of scanning the whole table.
         
         :param search_term: The term to search for
         :type search_term: str
-        :return: List of tuples containing (student_id, name, age, email)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            search_pattern = f"%{search_term}%"
-            cursor.execute('''
-                SELECT student_id, name, age, email
-                FROM students
-                WHERE name LIKE ? OR student_id LIKE ? OR email LIKE ?
-                ORDER BY name
-            ''', (search_pattern, search_pattern, search_pattern))
-            return cursor.fetchall()
-    
-    def search_instructors(self, search_term: str) -> List[Tuple]:
+        :param prefix: Match student names by prefix only, defaults to False
+        :type prefix: bool, optional
+        :return: List of rows containing (student_id, name, age, email)
+        :rtype: List[sqlite3.Row]
+        """
+        if prefix:
+            return self._fetchall(_SQL_SEARCH_STUDENTS_BY_NAME_PREFIX, (self._like_prefix(search_term),))
+        fts_query = self._fts_query(search_term)
+        if fts_query is not None:
+            return self._fetchall(_SQL_SEARCH_STUDENTS_FTS, (fts_query,))
+        search_pattern = f"%{search_term}%"
+        return self._fetchall(_SQL_SEARCH_STUDENTS, (search_pattern, search_pattern, search_pattern))
+    
+    def search_instructors(self, search_term: str, prefix: bool = False) -> List[sqlite3.Row]:
         """Search for instructors by name, ID, or email.
         
         Performs case-insensitive partial matching across all searchable fields.
+        Terms of three or more characters are answered from the full-text index.
+        With ``prefix`` set, only names starting with the term are matched, which
+        is answered from the name index instead of scanning the whole table.
         
         :param search_term: The term to search for
         :type search_term: str
-        :return: List of tuples containing (instructor_id, name, age, email)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            search_pattern = f"%{search_term}%"
-            cursor.execute('''
-                SELECT instructor_id, name, age, email
-                FROM instructors
-                WHERE name LIKE ? OR instructor_id LIKE ? OR email LIKE ?
-                ORDER BY name
-            ''', (search_pattern, search_pattern, search_pattern))
-            return cursor.fetchall()
-    
-    def search_courses(self, search_term: str) -> List[Tuple]:
+        :param prefix: Match instructor names by prefix only, defaults to False
+        :type prefix: bool, optional
+        :return: List of rows containing (instructor_id, name, age, email)
+        :rtype: List[sqlite3.Row]
+        """
+        if prefix:
+            return self._fetchall(_SQL_SEARCH_INSTRUCTORS_BY_NAME_PREFIX, (self._like_prefix(search_term),))
+        fts_query = self._fts_query(search_term)
+        if fts_query is not None:
+            return self._fetchall(_SQL_SEARCH_INSTRUCTORS_FTS, (fts_query,))
+        search_pattern = f"%{search_term}%"
+        return self._fetchall(_SQL_SEARCH_INSTRUCTORS, (search_pattern, search_pattern, search_pattern))
+    
+    def search_courses(self, search_term: str, prefix: bool = False) -> List[sqlite3.Row]:
         """Search for courses by name or ID.
         
         Performs case-insensitive partial matching and includes instructor information.
+        Terms of three or more characters are answered from the full-text index.
+        With ``prefix`` set, only course names starting with the term are matched,
+        which is answered from the course name index.
         
         :param search_term: The term to search for
         :type search_term: str
-        :return: List of tuples containing (course_id, course_name, instructor_id, instructor_name)
-        :rtype: List[Tuple]
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            search_pattern = f"%{search_term}%"
-            cursor.execute('''
-                SELECT c.course_id, c.course_name, i.instructor_id, i.name as instructor_name
-                FROM courses c
-                LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-                WHERE c.course_name LIKE ? OR c.course_id LIKE ?
-                ORDER BY c.course_name
-            ''', (search_pattern, search_pattern))
-            return cursor.fetchall()
+        :param prefix: Match course names by prefix only, defaults to False
+        :type prefix: bool, optional
+        :return: List of rows containing (course_id, course_name, instructor_id, instructor_name)
+        :rtype: List[sqlite3.Row]
+        """
+        if prefix:
+            return self._fetchall(_SQL_SEARCH_COURSES_BY_NAME_PREFIX, (self._like_prefix(search_term),))
+        fts_query = self._fts_query(search_term)
+        if fts_query is not None:
+            return self._fetchall(_SQL_SEARCH_COURSES_FTS, (fts_query,))
+        search_pattern = f"%{search_term}%"
+        return self._fetchall(_SQL_SEARCH_COURSES, (search_pattern, search_pattern))
     
     def load_system_from_db(self) -> SchoolManagementSystem:
         """Load all data from database into a SchoolManagementSystem object.
@@ -639,92 +1006,142 @@ class DatabaseManager:
         """
         system = SchoolManagementSystem()
         
-        instructors_data = self.get_all_instructors()
-        for instructor_id, name, age, email in instructors_data:
-            instructor = Instructor(name, age, email, instructor_id)
-            system.add_instructor(instructor)
-        
-        courses_data = self.get_all_courses()
-        for course_id, course_name, instructor_id, instructor_name in courses_data:
-            instructor = system.find_instructor_by_id(instructor_id) if instructor_id else None
-            course = Course(course_id, course_name, instructor)
-            system.add_course(course)
+        # Rows are consumed straight from the cursors rather than through the
+        # get_all_* helpers, so no intermediate result lists are built. The
+        # lock is held throughout because the cursors share the connection.
+        # Related objects are resolved through local id dicts instead of the
+        # system's linear find_*_by_id scans. Objects are built without
+        # re-running the model validation: rows are normally written from
+        # validated model objects, and one stray row should not make the
+        # whole load fail.
+        instructors_by_id = {}
+        courses_by_id = {}
+        with self._lock:
+            conn = self._conn
+            for row in conn.execute(_SQL_SELECT_INSTRUCTORS):
+                instructor = Instructor._from_validated(row['name'], row['age'], row['email'], row['instructor_id'])
+                system.add_instructor(instructor)
+                instructors_by_id[instructor.instructor_id] = instructor
             
-            if instructor:
-                instructor.assign_course(course)
-        
-        students_data = self.get_all_students()
-        for student_id, name, age, email in students_data:
-            student = Student(name, age, email, student_id)
-            system.add_student(student)
+            for row in conn.execute(_SQL_SELECT_COURSES):
+                instructor = instructors_by_id.get(row['instructor_id'])
+                course = Course._from_validated(row['course_id'], row['course_name'], instructor)
+                system.add_course(course)
+                courses_by_id[course.course_id] = course
+                
+                if instructor:
+                    instructor.assign_course(course)
+            
+            courses_by_student = defaultdict(list)
+            for row in conn.execute(_SQL_SELECT_REGISTRATIONS):
+                courses_by_student[row['student_id']].append(row['course_id'])
             
-            student_courses = self.get_student_courses(student_id)
-            for course_id, course_name in student_courses:
-                course = system.find_course_by_id(course_id)
-                if course:
-                    student.register_course(course)
+            for row in conn.execute(_SQL_SELECT_STUDENTS):
+                student = Student._from_validated(row['name'], row['age'], row['email'], row['student_id'])
+                system.add_student(student)
+                
+                for course_id in courses_by_student[student.student_id]:
+                    course = courses_by_id.get(course_id)
+                    if course:
+                        student.register_course(course)
         
         return system
     
     def sync_system_to_db(self, system: SchoolManagementSystem) -> bool:
         """Synchronize a SchoolManagementSystem object to the database.
         
-        Completely replaces all database contents with the data from the
-        provided system object. This operation is destructive and irreversible.
+        Makes the database contents match the provided system object. Records are
+        upserted, and rows whose IDs are no longer present in the system are deleted,
+        so only records that actually changed are written. Everything runs inside a
+        single transaction. If the incremental update trips a unique constraint (for
+        example two records swapping email addresses), the tables are cleared and
+        rewritten from the system object instead.
         
         :param system: The system object to synchronize to the database
         :type system: SchoolManagementSystem
         :return: True if synchronization was successful, False otherwise
         :rtype: bool
         """
+        student_rows = [
+            (student.student_id, student.name, student.age, student._email)
+            for student in system.students
+        ]
+        instructor_rows = [
+            (instructor.instructor_id, instructor.name, instructor.age, instructor._email)
+            for instructor in system.instructors
+        ]
+        course_rows = [
+            (course.course_id, course.course_name,
+             course.instructor.instructor_id if course.instructor else None)
+            for course in system.courses
+        ]
+        registration_rows = [
+            (student.student_id, course.course_id)
+            for student in system.students
+            for course in student.registered_courses
+        ]
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("DELETE FROM student_course_registrations")
-                cursor.execute("DELETE FROM courses")
-                cursor.execute("DELETE FROM instructors")
-                cursor.execute("DELETE FROM students")
-                
-                for student in system.students:
-                    cursor.execute('''
-                        INSERT INTO students (student_id, name, age, email)
-                        VALUES (?, ?, ?, ?)
-                    ''', (student.student_id, student.name, student.age, student.get_email()))
-                
-                for instructor in system.instructors:
-                    cursor.execute('''
-                        INSERT INTO instructors (instructor_id, name, age, email)
-                        VALUES (?, ?, ?, ?)
-                    ''', (instructor.instructor_id, instructor.name, instructor.age, instructor.get_email()))
-                
-                for course in system.courses:
-                    instructor_id = course.instructor.instructor_id if course.instructor else None
-                    cursor.execute('''
-                        INSERT INTO courses (course_id, course_name, instructor_id)
-                        VALUES (?, ?, ?)
-                    ''', (course.course_id, course.course_name, instructor_id))
-                
-                for student in system.students:
-                    for course in student.registered_courses:
-                        cursor.execute('''
-                            INSERT INTO student_course_registrations (student_id, course_id)
-                            VALUES (?, ?)
-                        ''', (student.student_id, course.course_id))
+            with self._transaction() as cursor:
+                try:
+                    self._delete_missing(cursor, _SQL_SELECT_REGISTRATION_IDS, _SQL_DELETE_REGISTRATION,
+                                         set(registration_rows))
+                    self._delete_missing(cursor, _SQL_SELECT_COURSE_IDS, _SQL_DELETE_COURSE,
+                                         {row[:1] for row in course_rows})
+                    self._delete_missing(cursor, _SQL_SELECT_STUDENT_IDS, _SQL_DELETE_STUDENT,
+                                         {row[:1] for row in student_rows})
+                    self._delete_missing(cursor, _SQL_SELECT_INSTRUCTOR_IDS, _SQL_DELETE_INSTRUCTOR,
+                                         {row[:1] for row in instructor_rows})
+                    
+                    cursor.executemany(_SQL_UPSERT_INSTRUCTOR, instructor_rows)
+                    cursor.executemany(_SQL_UPSERT_COURSE, course_rows)
+                    cursor.executemany(_SQL_UPSERT_STUDENT, student_rows)
+                    cursor.executemany(_SQL_UPSERT_REGISTRATION, registration_rows)
+                except sqlite3.IntegrityError:
+                    cursor.execute("DELETE FROM student_course_registrations")
+                    cursor.execute("DELETE FROM courses")
+                    cursor.execute("DELETE FROM instructors")
+                    cursor.execute("DELETE FROM students")
+                    
+                    cursor.executemany(_SQL_INSERT_STUDENT, student_rows)
+                    cursor.executemany(_SQL_INSERT_INSTRUCTOR, instructor_rows)
+                    cursor.executemany(_SQL_INSERT_COURSE, course_rows)
+                    cursor.executemany(_SQL_INSERT_REGISTRATION, registration_rows)
                 
-                conn.commit()
                 return True
         except Exception as e:
-            print(f"Error syncing system to database: {e}")
+            logger.exception("Error syncing system to database: %s", e)
             return False
     
-    def backup_database(self, backup_path: str = None) -> bool:
+    @staticmethod
+    def _delete_missing(cursor: sqlite3.Cursor, select_sql: str, delete_sql: str, keep: set):
+        """Delete the rows whose key is not in ``keep``.
+        
+        :param cursor: Cursor inside the sync transaction
+        :type cursor: sqlite3.Cursor
+        :param select_sql: Query returning the key columns of every row
+        :type select_sql: str
+        :param delete_sql: Statement deleting one row by its key columns
+        :type delete_sql: str
+        :param keep: Keys, as tuples, of the rows to keep
+        :type keep: set
+        """
+        stale = [key for key in map(tuple, cursor.execute(select_sql).fetchall()) if key not in keep]
+        if stale:
+            cursor.executemany(delete_sql, stale)
+    
+    def backup_database(self, backup_path: str = None, progress=None) -> bool:
         """Create a backup copy of the database file.
         
         Creates a timestamped backup copy of the database file for data recovery purposes.
+        The copy is taken with SQLite's online backup API rather than a file copy, so it
+        is consistent and includes changes still held in the write-ahead log.
         
         :param backup_path: Path for the backup file, defaults to auto-generated timestamped name
         :type backup_path: str, optional
+        :param progress: Callback invoked as ``progress(status, remaining, total)`` after each
+            batch of copied pages, e.g. to keep a GUI responsive
+        :type progress: callable, optional
         :return: True if backup was successful, False otherwise
         :rtype: bool
         """
@@ -733,59 +1150,67 @@ class DatabaseManager:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = f"school_management_backup_{timestamp}.db"
             
-            shutil.copy2(self.db_path, backup_path)
-            print(f"Database backed up to: {backup_path}")
+            dest = sqlite3.connect(backup_path)
+            try:
+                with self._lock:
+                    self._conn.backup(dest, pages=_BACKUP_PAGES_PER_STEP, progress=progress)
+            finally:
+                dest.close()
+            logger.info("Database backed up to: %s", backup_path)
             return True
         except Exception as e:
-            print(f"Error backing up database: {e}")
+            logger.exception("Error backing up database: %s", e)
             return False
     
     def get_database_statistics(self) -> dict:
         """Generate comprehensive database statistics.
         
         Provides overview statistics including record counts and popular courses.
+        A result is reused for up to ``_STATS_TTL`` seconds as long as no rows have
+        been changed through this manager's connection in the meantime; changes
+        made by other processes may take that long to show up.
         
         :return: Dictionary containing database statistics
         :rtype: dict
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM students")
-            student_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM instructors")
-            instructor_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM courses")
-            course_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM student_course_registrations")
-            registration_count = cursor.fetchone()[0]
+        with self._lock:
+            changes = self._conn.total_changes
+            if self._stats_cache is not None:
+                expires, cached_changes, stats = self._stats_cache
+                if cached_changes == changes and time.monotonic() < expires:
+                    return stats
             
-            cursor.execute('''
-                SELECT c.course_name, COUNT(scr.student_id) as enrollment_count
-                FROM courses c
-                LEFT JOIN student_course_registrations scr ON c.course_id = scr.course_id
-                GROUP BY c.course_id, c.course_name
-                ORDER BY enrollment_count DESC
-                LIMIT 5
-            ''')
-            popular_courses = cursor.fetchall()
+            counts = None
+            popular_courses = []
+            unenrolled_courses = []
+            for kind, *values in self._conn.execute(_SQL_STATISTICS, {'limit': _POPULAR_COURSES_LIMIT}):
+                if kind == 'counts':
+                    counts = values
+                elif kind == 'popular':
+                    popular_courses.append((values[0], values[1]))
+                else:
+                    unenrolled_courses.append((values[0], values[1]))
+            student_count, instructor_count, course_count, registration_count = counts
+            popular_courses.sort(key=lambda course: course[1], reverse=True)
+            popular_courses += unenrolled_courses
             
-            return {
+            stats = {
                 'total_students': student_count,
                 'total_instructors': instructor_count,
                 'total_courses': course_count,
                 'total_registrations': registration_count,
                 'popular_courses': popular_courses
             }
+            self._stats_cache = (time.monotonic() + _STATS_TTL, changes, stats)
+            return stats
     
     def export_to_csv(self, table_name: str, output_path: str) -> bool:
         """Export database table to CSV format.
         
         Exports the specified table or view to a CSV file with proper headers.
         Supports exporting students, instructors, courses, and registrations.
+        Rows are written in batches as they are read, so the full result set is
+        never held in memory.
         
         :param table_name: Name of the table to export ('students', 'instructors', 'courses', 'registrations')
         :type table_name: str
@@ -794,40 +1219,72 @@ class DatabaseManager:
         :return: True if export was successful, False otherwise
         :rtype: bool
         """
+        sql = _SQL_EXPORT.get(table_name)
+        if sql is None:
+            return False
+        
         try:
-            import csv
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                if table_name == 'students':
-                    cursor.execute("SELECT * FROM students")
-                elif table_name == 'instructors':
-                    cursor.execute("SELECT * FROM instructors")
-                elif table_name == 'courses':
-                    cursor.execute('''
-                        SELECT c.*, i.name as instructor_name
-                        FROM courses c
-                        LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-                    ''')
-                elif table_name == 'registrations':
-                    cursor.execute('''
-                        SELECT scr.*, s.name as student_name, c.course_name
-                        FROM student_course_registrations scr
-                        JOIN students s ON scr.student_id = s.student_id
-                        JOIN courses c ON scr.course_id = c.course_id
-                    ''')
-                else:
-                    return False
-                
-                data = cursor.fetchall()
-                column_names = [description[0] for description in cursor.description]
-                
-                with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(column_names)
-                    writer.writerows(data)
-                
+            with self._lock:
+                self._write_csv(self._conn.cursor(), sql, output_path)
+                return True
+        except Exception as e:
+            logger.exception("Error exporting to CSV: %s", e)
+            return False
+    
+    def export_tables_to_csv(self, table_names: List[str], output_dir: str) -> bool:
+        """Export several tables to CSV files from one consistent snapshot.
+        
+        All tables are read inside a single read transaction while holding the
+        connection lock once, so the files agree with each other even if the
+        database is written to between exports. Each table is written to
+        ``<output_dir>/<table_name>.csv``.
+        
+        :param table_names: Names of the tables to export, as accepted by :meth:`export_to_csv`
+        :type table_names: List[str]
+        :param output_dir: Directory that receives the CSV files
+        :type output_dir: str
+        :return: True if every table was exported, False otherwise
+        :rtype: bool
+        """
+        queries = [_SQL_EXPORT.get(table_name) for table_name in table_names]
+        if None in queries:
+            return False
+        
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN")
+                try:
+                    for table_name, sql in zip(table_names, queries):
+                        self._write_csv(cursor, sql, os.path.join(output_dir, f"{table_name}.csv"))
+                finally:
+                    cursor.execute("COMMIT")
                 return True
         except Exception as e:
-            print(f"Error exporting to CSV: {e}")
-            return False
\ No newline at end of file
+            logger.exception("Error exporting to CSV: %s", e)
+            return False
+    
+    @staticmethod
+    def _write_csv(cursor: sqlite3.Cursor, sql: str, output_path: str):
+        """Run an export query and stream its rows into a CSV file.
+        
+        The cursor is handed straight to ``writerows``, so rows are written as
+        SQLite steps through them and are never collected in memory. The column
+        names form the header row.
+        
+        :param cursor: Cursor on the shared connection
+        :type cursor: sqlite3.Cursor
+        :param sql: One of the :data:`_SQL_EXPORT` queries
+        :type sql: str
+        :param output_path: Path to the output CSV file
+        :type output_path: str
+        """
+        import csv
+        cursor.execute(sql)
+        column_names = [description[0] for description in cursor.description]
+        
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=_CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(column_names)
+            writer.writerows(cursor)
\ No newline at end of file
@@ -8,17 +8,61 @@ statistics, and backup functionality.
 
 import sys
 import csv
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain
+from operator import attrgetter, methodcaller
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTabWidget, QLabel, QLineEdit, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QComboBox, QMessageBox, 
+                             QTableWidget, QTableWidgetItem, QTableView, QComboBox, QMessageBox, 
                              QFileDialog, QFormLayout, QGroupBox, QHeaderView,
-                             QAbstractItemView, QTextEdit, QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt
+                             QAbstractItemView, QTextEdit, QDialog, QDialogButtonBox,
+                             QStyledItemDelegate, QStyleOptionViewItem)
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+                          QStringListModel, QThreadPool, QTimer, pyqtSignal)
 from PyQt5.QtGui import QFont
 from school_management import SchoolManagementSystem, Student, Instructor, Course
 from database_manager import DatabaseManager
 
 
+# Custom item role under which the table models return every role of a cell
+# in one dict, so the delegate crosses into Python once per painted cell.
+MultipleRolesRole = Qt.UserRole + 1
+_DEFAULT_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+# C-level getters for the per-record fields read while filling tables and the search index.
+_get_email = methodcaller("get_email")
+_student_fields = attrgetter("name", "student_id")
+_instructor_fields = attrgetter("name", "instructor_id")
+_course_fields = attrgetter("course_name", "course_id")
+
+# Search filter choices mapped to the record type they keep; "All" keeps every type.
+_SEARCH_FILTER_TYPES = {"Students": "Student", "Instructors": "Instructor", "Courses": "Course"}
+
+# Builders for the "Details" column of a search result, applied to matches only.
+_SEARCH_DETAILS = {
+    "Student": lambda s: f"Email: {s.get_email()}, Courses: {s.registered_course_names}",
+    "Instructor": lambda i: f"Email: {i.get_email()}, Courses: {i.assigned_course_names}",
+    "Course": lambda c: f"Instructor: {c.instructor.name if c.instructor else 'None'}, "
+                        f"Students: {c.enrolled_student_names}",
+}
+
+# Quiet period after the last keystroke before the search box is applied.
+_SEARCH_DEBOUNCE_MS = 150
+
+# Write buffer for CSV exports, so rows reach the file in large chunks.
+_CSV_BUFFER_SIZE = 1 << 20
+
+# What edit_selected and delete_selected need to know about the record type
+# shown on one tab of the data display.
+_RecordKind = namedtuple("_RecordKind", [
+    "noun", "title", "selection", "view", "model", "record_id", "record_name",
+    "edit_data", "validate", "update", "apply_edit", "delete", "remove",
+    "dependents", "combos",
+])
+
+
 class EditRecordDialog(QDialog):
     """Dialog window for editing student, instructor, and course records.
 
@@ -134,6 +178,280 @@ class EditRecordDialog(QDialog):
             }
 
 
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table model over a list of school records.
+
+    Views pull cell text lazily through :meth:`data`, and only for the rows
+    they actually paint, so refreshing a display resets the model instead of
+    allocating a ``QTableWidgetItem`` per cell. Subclasses describe their
+    columns as ``(header, accessor)`` pairs in :attr:`columns`; plain
+    fields use :mod:`operator` getters so the per-cell lookup runs in C.
+
+    :param rows: Records shown by the model, defaults to an empty list
+    :type rows: list, optional
+    :param parent: Parent object, defaults to None
+    :type parent: QObject, optional
+    """
+
+    columns = ()
+    
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._headers = [header for header, _ in self.columns]
+        self._accessors = [accessor for _, accessor in self.columns]
+        self._rows = rows if rows is not None else []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._accessors)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._accessors[index.column()](self._rows[index.row()])
+        if role == MultipleRolesRole:
+            return {Qt.DisplayRole: self._accessors[index.column()](self._rows[index.row()])}
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def set_rows(self, rows):
+        """Replace the records shown by the model.
+
+        :param rows: New list of records
+        :type rows: list
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def append_record(self, record, append=None):
+        """Append a record and notify attached views of the single new row.
+
+        :param record: Record to append
+        :type record: object
+        :param append: Callable that performs the append, for when the row
+                       list is owned by another object, defaults to
+                       ``list.append`` on the model's rows
+        :type append: callable, optional
+        """
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        (append or self._rows.append)(record)
+        self.endInsertRows()
+    
+    def refresh_record(self, record):
+        """Notify attached views that the cells of ``record`` changed.
+
+        :param record: Record whose row should be repainted
+        :type record: object
+        """
+        self.refresh_records((record,))
+    
+    def refresh_records(self, records):
+        """Notify attached views that the cells of several records changed.
+
+        The rows are located in one pass over the model, however many
+        records are given.
+
+        :param records: Records whose rows should be repainted
+        :type records: iterable
+        """
+        changed = {id(record) for record in records}
+        if not changed:
+            return
+        last_column = len(self._accessors) - 1
+        for row, candidate in enumerate(self._rows):
+            if id(candidate) in changed:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+    
+    def remove_record(self, record, remove):
+        """Remove a record and notify attached views of the single removed row.
+
+        :param record: Record to remove
+        :type record: object
+        :param remove: Callable that takes the record out of the row list,
+                       typically a ``SchoolManagementSystem.remove_*`` call
+        :type remove: callable
+        """
+        for row, candidate in enumerate(self._rows):
+            if candidate is record:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                remove()
+                self.endRemoveRows()
+                return
+        remove()
+    
+    def record(self, row):
+        """Return the record displayed at ``row``.
+
+        :param row: Row number in the model
+        :type row: int
+        :return: The record object, or None if the row is out of range
+        :rtype: object
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """Item delegate that fetches all roles of a cell with a single call.
+
+    :class:`QStyledItemDelegate` asks the model for the font, alignment,
+    colours, check state, decoration and display text of every cell it paints
+    or measures, which is one Python ``data()`` call per role. This delegate
+    asks for :data:`MultipleRolesRole` once and fills the style option from the
+    returned dict, falling back to the default behaviour for models that do
+    not provide it.
+    """
+
+    def initStyleOption(self, option, index):
+        roles = index.data(MultipleRolesRole)
+        if roles is None:
+            super().initStyleOption(option, index)
+            return
+        
+        option.index = index
+        option.displayAlignment = roles.get(Qt.TextAlignmentRole, _DEFAULT_ALIGNMENT)
+        text = roles.get(Qt.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = self.displayText(text, option.locale)
+
+
+class StudentTableModel(RecordTableModel):
+    """Table model listing students and their registered courses."""
+
+    columns = (
+        ("Name", attrgetter("name")),
+        ("Age", attrgetter("age")),
+        ("Email", _get_email),
+        ("Student ID", attrgetter("student_id")),
+        ("Registered Courses", attrgetter("registered_course_names")),
+    )
+
+
+class InstructorTableModel(RecordTableModel):
+    """Table model listing instructors and their assigned courses."""
+
+    columns = (
+        ("Name", attrgetter("name")),
+        ("Age", attrgetter("age")),
+        ("Email", _get_email),
+        ("Instructor ID", attrgetter("instructor_id")),
+        ("Assigned Courses", attrgetter("assigned_course_names")),
+    )
+
+
+class CourseTableModel(RecordTableModel):
+    """Table model listing courses with their instructor and students."""
+
+    columns = (
+        ("Course ID", attrgetter("course_id")),
+        ("Course Name", attrgetter("course_name")),
+        ("Instructor", lambda c: c.instructor.name if c.instructor else "None"),
+        ("Enrolled Students", attrgetter("enrolled_student_names")),
+    )
+
+
+class LazyComboBox(QComboBox):
+    """Combo box whose entries are built only when it is about to be seen.
+
+    Entries come from ``items_factory`` and are handed to the combo's
+    :class:`QStringListModel` in one ``setStringList`` call. After
+    :meth:`mark_dirty` the list is rebuilt the next time the combo is shown or
+    its popup is opened, so combos on tabs the user never visits cost nothing
+    to keep up to date. The current entry is kept across rebuilds if it still
+    exists.
+
+    :param items_factory: Callable returning the entry texts in display order
+    :type items_factory: callable
+    :param parent: Parent widget, defaults to None
+    :type parent: QWidget, optional
+    """
+
+    def __init__(self, items_factory, parent=None):
+        super().__init__(parent)
+        self.setModel(QStringListModel(self))
+        self._items_factory = items_factory
+        self._dirty = True
+    
+    def mark_dirty(self):
+        """Schedule a rebuild of the entries; visible combos rebuild at once."""
+        self._dirty = True
+        if self.isVisible():
+            self.populate()
+    
+    def populate(self):
+        """Rebuild the entries if they are out of date."""
+        if not self._dirty:
+            return
+        
+        current = self.currentText()
+        self.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        try:
+            self.model().setStringList(self._items_factory())
+            self.setCurrentIndex(max(self.findText(current), 0))
+        finally:
+            self.setUpdatesEnabled(True)
+            self.blockSignals(False)
+        self._dirty = False
+    
+    def showEvent(self, event):
+        self.populate()
+        super().showEvent(event)
+    
+    def showPopup(self):
+        self.populate()
+        super().showPopup()
+
+
+class DbTaskSignals(QObject):
+    """Signals through which a :class:`DbTask` reports back to the GUI thread.
+
+    The object is created on the GUI thread, so connected slots run there
+    even though the signals are emitted from a worker thread.
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class DbTask(QRunnable):
+    """Run one blocking database or file call on a :class:`QThreadPool` worker thread.
+
+    :param fn: Callable to run, typically a bound :class:`DatabaseManager` method
+    :type fn: callable
+    :param args: Positional arguments passed to ``fn``
+
+    :ivar signals: Emits ``finished`` with the call's return value, or
+                   ``failed`` with the error message if it raised
+    :vartype signals: DbTaskSignals
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.signals = DbTaskSignals()
+        self._fn = fn
+        self._args = args
+    
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class IntegratedSchoolManagement(QMainWindow):
     """Advanced PyQt5 application window with integrated database support.
 
@@ -168,7 +486,13 @@ class IntegratedSchoolManagement(QMainWindow):
         super().__init__()
         self.db_manager = DatabaseManager()
         self.system = self.db_manager.load_system_from_db()
+        self._search_index = None
+        # A single worker keeps database writes in the order they were issued.
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._pending_tasks = set()
         self.init_ui()
+        self._record_kinds = self._build_record_kinds()
         self.refresh_displays()
     
     def init_ui(self):
@@ -314,7 +638,7 @@ class IntegratedSchoolManagement(QMainWindow):
         
         self.course_id_edit = QLineEdit()
         self.course_name_edit = QLineEdit()
-        self.course_instructor_combo = QComboBox()
+        self.course_instructor_combo = LazyComboBox(lambda: ["None"] + self._instructor_combo_items())
         
         form_layout.addRow("Course ID:", self.course_id_edit)
         form_layout.addRow("Course Name:", self.course_name_edit)
@@ -352,8 +676,8 @@ class IntegratedSchoolManagement(QMainWindow):
         student_reg_group = QGroupBox("Student Registration")
         student_reg_layout = QFormLayout()
         
-        self.reg_student_combo = QComboBox()
-        self.reg_course_combo = QComboBox()
+        self.reg_student_combo = LazyComboBox(self._student_combo_items)
+        self.reg_course_combo = LazyComboBox(self._course_combo_items)
         
         student_reg_layout.addRow("Student:", self.reg_student_combo)
         student_reg_layout.addRow("Course:", self.reg_course_combo)
@@ -368,8 +692,8 @@ class IntegratedSchoolManagement(QMainWindow):
         instructor_assign_group = QGroupBox("Instructor Assignment")
         instructor_assign_layout = QFormLayout()
         
-        self.assign_instructor_combo = QComboBox()
-        self.assign_course_combo = QComboBox()
+        self.assign_instructor_combo = LazyComboBox(self._instructor_combo_items)
+        self.assign_course_combo = LazyComboBox(self._course_combo_items)
         
         instructor_assign_layout.addRow("Instructor:", self.assign_instructor_combo)
         instructor_assign_layout.addRow("Course:", self.assign_course_combo)
@@ -392,24 +716,24 @@ class IntegratedSchoolManagement(QMainWindow):
         button_layout = QHBoxLayout()
         
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.refresh_displays)
-        save_btn = QPushButton("Save to JSON")
-        save_btn.clicked.connect(self.save_to_json)
-        load_btn = QPushButton("Load from JSON")
-        load_btn.clicked.connect(self.load_from_json)
+        refresh_btn.clicked.connect(self.reload_from_database)
+        self.save_btn = QPushButton("Save to JSON")
+        self.save_btn.clicked.connect(self.save_to_json)
+        self.load_btn = QPushButton("Load from JSON")
+        self.load_btn.clicked.connect(self.load_from_json)
         edit_btn = QPushButton("Edit Selected")
         edit_btn.clicked.connect(self.edit_selected)
         delete_btn = QPushButton("Delete Selected")
         delete_btn.clicked.connect(self.delete_selected)
-        export_csv_btn = QPushButton("Export to CSV")
-        export_csv_btn.clicked.connect(self.export_to_csv)
+        self.export_csv_btn = QPushButton("Export to CSV")
+        self.export_csv_btn.clicked.connect(self.export_to_csv)
         
         button_layout.addWidget(refresh_btn)
-        button_layout.addWidget(save_btn)
-        button_layout.addWidget(load_btn)
+        button_layout.addWidget(self.save_btn)
+        button_layout.addWidget(self.load_btn)
         button_layout.addWidget(edit_btn)
         button_layout.addWidget(delete_btn)
-        button_layout.addWidget(export_csv_btn)
+        button_layout.addWidget(self.export_csv_btn)
         button_layout.addStretch()
         
         layout.addLayout(button_layout)
@@ -427,11 +751,13 @@ class IntegratedSchoolManagement(QMainWindow):
         
         layout = QVBoxLayout(student_widget)
         
-        self.student_table = QTableWidget()
-        self.student_table.setColumnCount(5)
-        self.student_table.setHorizontalHeaderLabels(["Name", "Age", "Email", "Student ID", "Registered Courses"])
+        self.student_model = StudentTableModel(parent=self)
+        self.student_table = QTableView()
+        self.student_table.setModel(self.student_model)
+        self.student_table.setItemDelegate(SpeedUpDelegate(self.student_table))
         self.student_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.student_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.student_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         
         layout.addWidget(self.student_table)
     
@@ -441,11 +767,13 @@ class IntegratedSchoolManagement(QMainWindow):
         
         layout = QVBoxLayout(instructor_widget)
         
-        self.instructor_table = QTableWidget()
-        self.instructor_table.setColumnCount(5)
-        self.instructor_table.setHorizontalHeaderLabels(["Name", "Age", "Email", "Instructor ID", "Assigned Courses"])
+        self.instructor_model = InstructorTableModel(parent=self)
+        self.instructor_table = QTableView()
+        self.instructor_table.setModel(self.instructor_model)
+        self.instructor_table.setItemDelegate(SpeedUpDelegate(self.instructor_table))
         self.instructor_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.instructor_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.instructor_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         
         layout.addWidget(self.instructor_table)
     
@@ -455,11 +783,13 @@ class IntegratedSchoolManagement(QMainWindow):
         
         layout = QVBoxLayout(course_widget)
         
-        self.course_table = QTableWidget()
-        self.course_table.setColumnCount(4)
-        self.course_table.setHorizontalHeaderLabels(["Course ID", "Course Name", "Instructor", "Enrolled Students"])
+        self.course_model = CourseTableModel(parent=self)
+        self.course_table = QTableView()
+        self.course_table.setModel(self.course_model)
+        self.course_table.setItemDelegate(SpeedUpDelegate(self.course_table))
         self.course_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.course_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.course_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         
         layout.addWidget(self.course_table)
     
@@ -478,13 +808,17 @@ class IntegratedSchoolManagement(QMainWindow):
         
         search_layout.addWidget(QLabel("Search:"))
         self.search_edit = QLineEdit()
-        self.search_edit.textChanged.connect(self.on_search)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._do_search)
+        self.search_edit.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(self.search_edit)
         
         search_layout.addWidget(QLabel("Filter by:"))
         self.search_filter_combo = QComboBox()
         self.search_filter_combo.addItems(["All", "Students", "Instructors", "Courses"])
-        self.search_filter_combo.currentTextChanged.connect(self.on_search)
+        self.search_filter_combo.currentTextChanged.connect(self._do_search)
         search_layout.addWidget(self.search_filter_combo)
         
         search_layout.addStretch()
@@ -528,13 +862,13 @@ class IntegratedSchoolManagement(QMainWindow):
         backup_group = QGroupBox("Database Management")
         backup_layout = QHBoxLayout()
         
-        backup_btn = QPushButton("Backup Database")
-        backup_btn.clicked.connect(self.backup_database)
-        export_all_csv_btn = QPushButton("Export All Tables to CSV")
-        export_all_csv_btn.clicked.connect(self.export_all_to_csv)
+        self.backup_btn = QPushButton("Backup Database")
+        self.backup_btn.clicked.connect(self.backup_database)
+        self.export_all_csv_btn = QPushButton("Export All Tables to CSV")
+        self.export_all_csv_btn.clicked.connect(self.export_all_to_csv)
         
-        backup_layout.addWidget(backup_btn)
-        backup_layout.addWidget(export_all_csv_btn)
+        backup_layout.addWidget(self.backup_btn)
+        backup_layout.addWidget(self.export_all_csv_btn)
         backup_layout.addStretch()
         
         backup_group.setLayout(backup_layout)
@@ -560,6 +894,8 @@ class IntegratedSchoolManagement(QMainWindow):
         :raises ValueError: If age cannot be converted to integer or other validation fails
         :raises Exception: If database operation fails or other unexpected error occurs
         """
+        if self._loading_json():
+            return
         try:
             name = self.student_name_edit.text().strip()
             age_text = self.student_age_edit.text().strip()
@@ -578,19 +914,24 @@ class IntegratedSchoolManagement(QMainWindow):
             
             student = Student(name, age, email, student_id)
             
-            if self.db_manager.add_student(student):
-                self.system.add_student(student)
-                self.clear_student_form()
-                self.refresh_displays()
-                QMessageBox.information(self, "Success", "Student added successfully")
-            else:
-                QMessageBox.warning(self, "Error", "Failed to add student. Student ID or email may already exist.")
+            self._run_db_task(partial(self._on_student_added, student), "An error occurred",
+                              self.db_manager.add_student, student)
         
         except ValueError as e:
             QMessageBox.warning(self, "Validation Error", str(e))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     
+    def _on_student_added(self, student, added):
+        if added:
+            self.student_model.append_record(student, self.system.add_student)
+            self.reg_student_combo.mark_dirty()
+            self.clear_student_form()
+            self._refresh_search()
+            QMessageBox.information(self, "Success", "Student added successfully")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to add student. Student ID or email may already exist.")
+    
     def add_instructor(self):
         """Add a new instructor to the database and system.
 
@@ -607,6 +948,8 @@ class IntegratedSchoolManagement(QMainWindow):
         :raises ValueError: If age cannot be converted to integer or other validation fails
         :raises Exception: If database operation fails or other unexpected error occurs
         """
+        if self._loading_json():
+            return
         try:
             name = self.instructor_name_edit.text().strip()
             age_text = self.instructor_age_edit.text().strip()
@@ -625,19 +968,25 @@ class IntegratedSchoolManagement(QMainWindow):
             
             instructor = Instructor(name, age, email, instructor_id)
             
-            if self.db_manager.add_instructor(instructor):
-                self.system.add_instructor(instructor)
-                self.clear_instructor_form()
-                self.refresh_displays()
-                QMessageBox.information(self, "Success", "Instructor added successfully")
-            else:
-                QMessageBox.warning(self, "Error", "Failed to add instructor. Instructor ID or email may already exist.")
+            self._run_db_task(partial(self._on_instructor_added, instructor), "An error occurred",
+                              self.db_manager.add_instructor, instructor)
         
         except ValueError as e:
             QMessageBox.warning(self, "Validation Error", str(e))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     
+    def _on_instructor_added(self, instructor, added):
+        if added:
+            self.instructor_model.append_record(instructor, self.system.add_instructor)
+            self.course_instructor_combo.mark_dirty()
+            self.assign_instructor_combo.mark_dirty()
+            self.clear_instructor_form()
+            self._refresh_search()
+            QMessageBox.information(self, "Success", "Instructor added successfully")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to add instructor. Instructor ID or email may already exist.")
+    
     def add_course(self):
         """Add a new course to the database and system.
 
@@ -654,6 +1003,8 @@ class IntegratedSchoolManagement(QMainWindow):
         :raises ValueError: If validation fails or instructor not found
         :raises Exception: If database operation fails or other unexpected error occurs
         """
+        if self._loading_json():
+            return
         try:
             course_id = self.course_id_edit.text().strip()
             course_name = self.course_name_edit.text().strip()
@@ -670,22 +1021,31 @@ class IntegratedSchoolManagement(QMainWindow):
             
             course = Course(course_id, course_name, instructor)
             
-            if self.db_manager.add_course(course):
-                self.system.add_course(course)
-                if instructor:
-                    instructor.assign_course(course)
-                self.clear_course_form()
-                self.refresh_displays()
-                QMessageBox.information(self, "Success", "Course added successfully")
-            else:
-                QMessageBox.warning(self, "Error", "Failed to add course. Course ID may already exist.")
+            self._run_db_task(partial(self._on_course_added, course), "An error occurred",
+                              self.db_manager.add_course, course)
         
         except ValueError as e:
             QMessageBox.warning(self, "Validation Error", str(e))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     
+    def _on_course_added(self, course, added):
+        if added:
+            self.course_model.append_record(course, self.system.add_course)
+            if course.instructor:
+                course.instructor.assign_course(course)
+                self.instructor_model.refresh_record(course.instructor)
+            self.reg_course_combo.mark_dirty()
+            self.assign_course_combo.mark_dirty()
+            self.clear_course_form()
+            self._refresh_search()
+            QMessageBox.information(self, "Success", "Course added successfully")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to add course. Course ID may already exist.")
+    
     def register_student(self):
+        if self._loading_json():
+            return
         try:
             student_selection = self.reg_student_combo.currentText()
             course_selection = self.reg_course_combo.currentText()
@@ -704,13 +1064,15 @@ class IntegratedSchoolManagement(QMainWindow):
                 QMessageBox.warning(self, "Error", "Student or course not found")
                 return
             
-            if course in student.registered_courses:
+            if student.is_registered(course):
                 QMessageBox.information(self, "Warning", "Student is already registered for this course")
                 return
             
             if self.db_manager.register_student_to_course(student_id, course_id):
                 student.register_course(course)
-                self.refresh_displays()
+                self.student_model.refresh_record(student)
+                self.course_model.refresh_record(course)
+                self._refresh_search()
                 QMessageBox.information(self, "Success", "Student registered successfully")
             else:
                 QMessageBox.warning(self, "Error", "Failed to register student")
@@ -719,6 +1081,8 @@ class IntegratedSchoolManagement(QMainWindow):
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     
     def assign_instructor(self):
+        if self._loading_json():
+            return
         try:
             instructor_selection = self.assign_instructor_combo.currentText()
             course_selection = self.assign_course_combo.currentText()
@@ -737,18 +1101,24 @@ class IntegratedSchoolManagement(QMainWindow):
                 QMessageBox.warning(self, "Error", "Instructor or course not found")
                 return
             
-            if course.instructor:
+            previous_instructor = course.instructor
+            if previous_instructor:
                 reply = QMessageBox.question(self, "Confirm", 
-                                           f"Course already has instructor {course.instructor.name}. Replace?",
+                                           f"Course already has instructor {previous_instructor.name}. Replace?",
                                            QMessageBox.Yes | QMessageBox.No)
                 if reply == QMessageBox.No:
                     return
-                if course in course.instructor.assigned_courses:
-                    course.instructor.assigned_courses.remove(course)
             
+            # Only touch the in-memory links once the database has the change,
+            # so a failed update leaves both sides on the previous instructor.
             if self.db_manager.update_course(course_id, instructor_id=instructor_id):
+                if previous_instructor:
+                    previous_instructor.unassign_course(course)
+                    self.instructor_model.refresh_record(previous_instructor)
                 instructor.assign_course(course)
-                self.refresh_displays()
+                self.instructor_model.refresh_record(instructor)
+                self.course_model.refresh_record(course)
+                self._refresh_search()
                 QMessageBox.information(self, "Success", "Instructor assigned successfully")
             else:
                 QMessageBox.warning(self, "Error", "Failed to assign instructor")
@@ -756,312 +1126,458 @@ class IntegratedSchoolManagement(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     
+    def reload_from_database(self):
+        """Reload the in-memory system from the database and refresh the displays.
+
+        The window otherwise keeps :attr:`system` in step with every write it
+        makes, so this is only needed to pick up changes made outside the
+        application.
+        """
+        if self._loading_json():
+            return
+        self.system = self.db_manager.load_system_from_db()
+        self.refresh_displays()
+    
     def refresh_displays(self):
         """Refresh all table displays and dropdown menus with current data.
 
-        Reloads the entire system from the database and updates all GUI components
-        to reflect the current state. This includes:
+        Rebuilds all GUI components from the in-memory system, which is loaded
+        from the database once at start-up and updated alongside every write.
+        This includes:
         - Student, instructor, and course tables
         - All dropdown menus for registration and assignment
         - Search results table
 
-        This method should be called after any database modification operation
-        to ensure the GUI displays accurate, up-to-date information.
+        This method should be called after any modification that is not
+        applied to the displays incrementally.
         """
-        self.system = self.db_manager.load_system_from_db()
-        
-        self.student_table.setRowCount(len(self.system.students))
-        for i, student in enumerate(self.system.students):
-            courses = ", ".join([course.course_name for course in student.registered_courses])
-            self.student_table.setItem(i, 0, QTableWidgetItem(student.name))
-            self.student_table.setItem(i, 1, QTableWidgetItem(str(student.age)))
-            self.student_table.setItem(i, 2, QTableWidgetItem(student.get_email()))
-            self.student_table.setItem(i, 3, QTableWidgetItem(student.student_id))
-            self.student_table.setItem(i, 4, QTableWidgetItem(courses))
-        
-        self.instructor_table.setRowCount(len(self.system.instructors))
-        for i, instructor in enumerate(self.system.instructors):
-            courses = ", ".join([course.course_name for course in instructor.assigned_courses])
-            self.instructor_table.setItem(i, 0, QTableWidgetItem(instructor.name))
-            self.instructor_table.setItem(i, 1, QTableWidgetItem(str(instructor.age)))
-            self.instructor_table.setItem(i, 2, QTableWidgetItem(instructor.get_email()))
-            self.instructor_table.setItem(i, 3, QTableWidgetItem(instructor.instructor_id))
-            self.instructor_table.setItem(i, 4, QTableWidgetItem(courses))
-        
-        self.course_table.setRowCount(len(self.system.courses))
-        for i, course in enumerate(self.system.courses):
-            instructor_name = course.instructor.name if course.instructor else "None"
-            students = ", ".join([student.name for student in course.enrolled_students])
-            self.course_table.setItem(i, 0, QTableWidgetItem(course.course_id))
-            self.course_table.setItem(i, 1, QTableWidgetItem(course.course_name))
-            self.course_table.setItem(i, 2, QTableWidgetItem(instructor_name))
-            self.course_table.setItem(i, 3, QTableWidgetItem(students))
-        
-        self.course_instructor_combo.clear()
-        self.course_instructor_combo.addItem("None")
-        for instructor in self.system.instructors:
-            self.course_instructor_combo.addItem(f"{instructor.instructor_id} - {instructor.name}")
-        
-        self.assign_instructor_combo.clear()
-        for instructor in self.system.instructors:
-            self.assign_instructor_combo.addItem(f"{instructor.instructor_id} - {instructor.name}")
-        
-        self.reg_student_combo.clear()
+        with self._bulk_update(self.student_table):
+            self.student_model.set_rows(self.system.students)
+        with self._bulk_update(self.instructor_table):
+            self.instructor_model.set_rows(self.system.instructors)
+        with self._bulk_update(self.course_table):
+            self.course_model.set_rows(self.system.courses)
+        
+        for combo in (self.course_instructor_combo, self.assign_instructor_combo,
+                      self.reg_student_combo, self.reg_course_combo, self.assign_course_combo):
+            combo.mark_dirty()
+        
+        self._refresh_search()
+    
+    @staticmethod
+    @contextmanager
+    def _bulk_update(view):
+        """Suspend repainting and sorting of a table view while it is refilled.
+
+        The view is laid out and painted once when the block exits instead of
+        after every row or cell change made inside it.
+
+        :param view: Table view or widget being refilled
+        :type view: QTableView
+        """
+        sorting_enabled = view.isSortingEnabled()
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            view.setSortingEnabled(sorting_enabled)
+            view.setUpdatesEnabled(True)
+    
+    def _student_combo_items(self):
+        return [f"{student.student_id} - {student.name}" for student in self.system.students]
+    
+    def _instructor_combo_items(self):
+        return [f"{instructor.instructor_id} - {instructor.name}" for instructor in self.system.instructors]
+    
+    def _course_combo_items(self):
+        return [f"{course.course_id} - {course.course_name}" for course in self.system.courses]
+    
+    def _build_search_index(self):
+        """Build the flat, pre-lowercased index scanned by :meth:`_do_search`.
+
+        Each entry is ``(type, name, id, record, lowered_fields)`` where
+        ``lowered_fields`` holds the lowercase strings a search term is
+        matched against. The details text is not stored; it is built from
+        ``record`` only for entries that match. Entries keep the student,
+        instructor, course order of the search results.
+
+        :return: The search index
+        :rtype: list
+        """
+        index = []
         for student in self.system.students:
-            self.reg_student_combo.addItem(f"{student.student_id} - {student.name}")
-        
-        self.reg_course_combo.clear()
-        self.assign_course_combo.clear()
+            name, student_id = _student_fields(student)
+            index.append(("Student", name, student_id, student,
+                          (name.lower(), student_id.lower(), student.get_email().lower())))
+        for instructor in self.system.instructors:
+            name, instructor_id = _instructor_fields(instructor)
+            index.append(("Instructor", name, instructor_id, instructor,
+                          (name.lower(), instructor_id.lower(), instructor.get_email().lower())))
         for course in self.system.courses:
-            course_text = f"{course.course_id} - {course.course_name}"
-            self.reg_course_combo.addItem(course_text)
-            self.assign_course_combo.addItem(course_text)
-        
-        self.on_search()
+            course_name, course_id = _course_fields(course)
+            index.append(("Course", course_name, course_id, course,
+                          (course_name.lower(), course_id.lower())))
+        return index
     
-    def on_search(self):
-        self.search_table.setRowCount(0)
+    def _refresh_search(self):
+        """Drop the cached search index and rerun the current search."""
+        self._search_index = None
+        self._do_search()
+    
+    def _do_search(self):
+        self._search_timer.stop()
+        
+        if self._search_index is None:
+            self._search_index = self._build_search_index()
         
         search_term = self.search_edit.text().lower()
-        filter_type = self.search_filter_combo.currentText()
-        
-        results = []
-        
-        if filter_type in ["All", "Students"]:
-            for student in self.system.students:
-                if (search_term in student.name.lower() or 
-                    search_term in student.student_id.lower() or
-                    search_term in student.get_email().lower()):
-                    courses = ", ".join([course.course_name for course in student.registered_courses])
-                    results.append(["Student", student.name, student.student_id, f"Email: {student.get_email()}, Courses: {courses}"])
-        
-        if filter_type in ["All", "Instructors"]:
-            for instructor in self.system.instructors:
-                if (search_term in instructor.name.lower() or 
-                    search_term in instructor.instructor_id.lower() or
-                    search_term in instructor.get_email().lower()):
-                    courses = ", ".join([course.course_name for course in instructor.assigned_courses])
-                    results.append(["Instructor", instructor.name, instructor.instructor_id, f"Email: {instructor.get_email()}, Courses: {courses}"])
-        
-        if filter_type in ["All", "Courses"]:
-            for course in self.system.courses:
-                if (search_term in course.course_name.lower() or 
-                    search_term in course.course_id.lower()):
-                    instructor_name = course.instructor.name if course.instructor else "None"
-                    students = ", ".join([student.name for student in course.enrolled_students])
-                    results.append(["Course", course.course_name, course.course_id, f"Instructor: {instructor_name}, Students: {students}"])
-        
-        self.search_table.setRowCount(len(results))
-        for i, result in enumerate(results):
-            for j, value in enumerate(result):
-                self.search_table.setItem(i, j, QTableWidgetItem(str(value)))
+        record_type = _SEARCH_FILTER_TYPES.get(self.search_filter_combo.currentText())
+        
+        results = [(kind, name, record_id, _SEARCH_DETAILS[kind](record))
+                   for kind, name, record_id, record, lowered_fields in self._search_index
+                   if (record_type is None or kind == record_type)
+                   and any(search_term in field for field in lowered_fields)]
+        
+        # Rows that already exist keep their items and only get new text;
+        # items are allocated just for rows beyond the previous result count.
+        table = self.search_table
+        with self._bulk_update(table):
+            reused_rows = min(table.rowCount(), len(results))
+            table.setRowCount(len(results))
+            for i, result in enumerate(results):
+                if i < reused_rows:
+                    for j, value in enumerate(result):
+                        table.item(i, j).setText(value)
+                else:
+                    for j, value in enumerate(result):
+                        table.setItem(i, j, QTableWidgetItem(value))
     
     def edit_selected(self):
-        current_tab = self.display_tab_widget.currentIndex()
-        
-        if current_tab == 0:  # Students
-            current_row = self.student_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select a student to edit")
-                return
-            
-            student_data = {
-                'name': self.student_table.item(current_row, 0).text(),
-                'age': int(self.student_table.item(current_row, 1).text()),
-                'email': self.student_table.item(current_row, 2).text(),
-                'id': self.student_table.item(current_row, 3).text()
-            }
-            
-            dialog = EditRecordDialog("Student", student_data, self)
-            if dialog.exec_() == QDialog.Accepted:
-                new_data = dialog.get_data()
-                if self.db_manager.update_student(student_data['id'], new_data['name'], new_data['age'], new_data['email']):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Student updated successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to update student")
-        
-        elif current_tab == 1:  # Instructors
-            current_row = self.instructor_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select an instructor to edit")
-                return
-            
-            instructor_data = {
-                'name': self.instructor_table.item(current_row, 0).text(),
-                'age': int(self.instructor_table.item(current_row, 1).text()),
-                'email': self.instructor_table.item(current_row, 2).text(),
-                'id': self.instructor_table.item(current_row, 3).text()
-            }
-            
-            dialog = EditRecordDialog("Instructor", instructor_data, self)
-            if dialog.exec_() == QDialog.Accepted:
+        if self._loading_json():
+            return
+        kind = self._record_kinds[self.display_tab_widget.currentIndex()]
+        record = kind.model.record(kind.view.currentIndex().row())
+        if record is None:
+            QMessageBox.warning(self, "Warning", f"Please select {kind.selection} to edit")
+            return
+        
+        dialog = EditRecordDialog(kind.title, kind.edit_data(record), self)
+        if dialog.exec_() == QDialog.Accepted:
+            try:
                 new_data = dialog.get_data()
-                if self.db_manager.update_instructor(instructor_data['id'], new_data['name'], new_data['age'], new_data['email']):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Instructor updated successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to update instructor")
-        
-        elif current_tab == 2:  # Courses
-            current_row = self.course_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select a course to edit")
+                edited = kind.validate(record, new_data)
+            except ValueError as e:
+                QMessageBox.warning(self, "Validation Error", str(e))
                 return
             
-            course_data = {
-                'id': self.course_table.item(current_row, 0).text(),
-                'name': self.course_table.item(current_row, 1).text()
-            }
-            
-            dialog = EditRecordDialog("Course", course_data, self)
-            if dialog.exec_() == QDialog.Accepted:
-                new_data = dialog.get_data()
-                if self.db_manager.update_course(course_data['id'], new_data['name']):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Course updated successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to update course")
+            if kind.update(record, new_data):
+                kind.apply_edit(record, edited)
+                kind.model.refresh_record(record)
+                self._refresh_dependents(kind, kind.dependents([record]))
+                QMessageBox.information(self, "Success", f"{kind.title} updated successfully")
+            else:
+                QMessageBox.warning(self, "Error", f"Failed to update {kind.noun}")
+    
+    @staticmethod
+    def _selected_records(view, model):
+        """Return the records of the rows selected in a table view.
+
+        Falls back to the current row when nothing is selected.
+
+        :param view: The table view
+        :type view: QTableView
+        :param model: The view's record model
+        :type model: RecordTableModel
+        :return: Selected records in row order
+        :rtype: list
+        """
+        rows = sorted({index.row() for index in view.selectionModel().selectedRows()})
+        if not rows:
+            rows = [view.currentIndex().row()]
+        return [record for record in map(model.record, rows) if record is not None]
     
     def delete_selected(self):
-        current_tab = self.display_tab_widget.currentIndex()
-        
-        if current_tab == 0:  # Students
-            current_row = self.student_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select a student to delete")
-                return
-            
-            student_id = self.student_table.item(current_row, 3).text()
-            student_name = self.student_table.item(current_row, 0).text()
-            
-            reply = QMessageBox.question(self, "Confirm", f"Delete student {student_name}?",
-                                       QMessageBox.Yes | QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                if self.db_manager.delete_student(student_id):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Student deleted successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to delete student")
-        
-        elif current_tab == 1:  # Instructors
-            current_row = self.instructor_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select an instructor to delete")
-                return
-            
-            instructor_id = self.instructor_table.item(current_row, 3).text()
-            instructor_name = self.instructor_table.item(current_row, 0).text()
-            
-            reply = QMessageBox.question(self, "Confirm", f"Delete instructor {instructor_name}?",
-                                       QMessageBox.Yes | QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                if self.db_manager.delete_instructor(instructor_id):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Instructor deleted successfully")
+        if self._loading_json():
+            return
+        kind = self._record_kinds[self.display_tab_widget.currentIndex()]
+        records = self._selected_records(kind.view, kind.model)
+        if not records:
+            QMessageBox.warning(self, "Warning", f"Please select {kind.selection} to delete")
+            return
+        
+        record_ids = [kind.record_id(record) for record in records]
+        prompt = (f"Delete {kind.noun} {kind.record_name(records[0])}?" if len(records) == 1
+                  else f"Delete {len(records)} {kind.noun}s?")
+        
+        reply = QMessageBox.question(self, "Confirm", prompt,
+                                   QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            deleted = kind.delete(record_ids)
+            if deleted:
+                # Only drop what the database actually deleted, so memory stays in step.
+                deleted = set(deleted)
+                records = [record for record in records if kind.record_id(record) in deleted]
+                # Collect the related rows before the records are unlinked from them.
+                dependents = kind.dependents(records)
+                for record in records:
+                    kind.model.remove_record(record, partial(kind.remove, kind.record_id(record)))
+                self._refresh_dependents(kind, dependents)
+                if len(records) < len(record_ids):
+                    QMessageBox.warning(self, "Warning",
+                                        f"Deleted {len(records)} of {len(record_ids)} {kind.noun}s; "
+                                        "the rest were no longer in the database")
                 else:
-                    QMessageBox.warning(self, "Error", "Failed to delete instructor")
-        
-        elif current_tab == 2:  # Courses
-            current_row = self.course_table.currentRow()
-            if current_row < 0:
-                QMessageBox.warning(self, "Warning", "Please select a course to delete")
-                return
-            
-            course_id = self.course_table.item(current_row, 0).text()
-            course_name = self.course_table.item(current_row, 1).text()
-            
-            reply = QMessageBox.question(self, "Confirm", f"Delete course {course_name}?",
-                                       QMessageBox.Yes | QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                if self.db_manager.delete_course(course_id):
-                    self.refresh_displays()
-                    QMessageBox.information(self, "Success", "Course deleted successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to delete course")
+                    QMessageBox.information(self, "Success", f"{kind.title} deleted successfully")
+            else:
+                QMessageBox.warning(self, "Error", f"Failed to delete {kind.noun}")
+    
+    def _refresh_dependents(self, kind, dependents):
+        """Update what shows a record's data after it was edited or deleted.
+
+        Refreshes the related rows in the other tables, marks the record's
+        combo boxes for a rebuild and refreshes the search results.
+
+        :param kind: Description of the edited or deleted record type
+        :type kind: _RecordKind
+        :param dependents: ``(model, rows)`` pairs returned by ``kind.dependents``
+        :type dependents: list
+        """
+        for model, rows in dependents:
+            model.refresh_records(rows)
+        for combo in kind.combos:
+            combo.mark_dirty()
+        self._refresh_search()
+    
+    def _build_record_kinds(self):
+        """Build the per-tab descriptions used by :meth:`edit_selected` and :meth:`delete_selected`.
+
+        :return: One :class:`_RecordKind` per tab of the data display, in tab order
+        :rtype: list
+        """
+        # The remove callables look self.system up on each call, because loading
+        # a JSON file replaces the system.
+        return [
+            _RecordKind(
+                noun="student", title="Student", selection="a student",
+                view=self.student_table, model=self.student_model,
+                record_id=attrgetter("student_id"), record_name=attrgetter("name"),
+                edit_data=lambda s: {'name': s.name, 'age': s.age, 'email': s.get_email(), 'id': s.student_id},
+                validate=lambda s, new: Student(new['name'], new['age'], new['email'], s.student_id),
+                update=lambda s, new: self.db_manager.update_student(s.student_id, new['name'], new['age'], new['email']),
+                apply_edit=self._apply_person_edit,
+                delete=self.db_manager.delete_students,
+                remove=lambda student_id: self.system.remove_student(student_id),
+                dependents=lambda students: [
+                    (self.course_model, [course for student in students for course in student.registered_courses])],
+                combos=(self.reg_student_combo,)),
+            _RecordKind(
+                noun="instructor", title="Instructor", selection="an instructor",
+                view=self.instructor_table, model=self.instructor_model,
+                record_id=attrgetter("instructor_id"), record_name=attrgetter("name"),
+                edit_data=lambda i: {'name': i.name, 'age': i.age, 'email': i.get_email(), 'id': i.instructor_id},
+                validate=lambda i, new: Instructor(new['name'], new['age'], new['email'], i.instructor_id),
+                update=lambda i, new: self.db_manager.update_instructor(i.instructor_id, new['name'], new['age'], new['email']),
+                apply_edit=self._apply_person_edit,
+                delete=self.db_manager.delete_instructors,
+                remove=lambda instructor_id: self.system.remove_instructor(instructor_id),
+                dependents=lambda instructors: [
+                    (self.course_model, [course for instructor in instructors for course in instructor.assigned_courses])],
+                combos=(self.course_instructor_combo, self.assign_instructor_combo)),
+            _RecordKind(
+                noun="course", title="Course", selection="a course",
+                view=self.course_table, model=self.course_model,
+                record_id=attrgetter("course_id"), record_name=attrgetter("course_name"),
+                edit_data=lambda c: {'id': c.course_id, 'name': c.course_name},
+                validate=lambda c, new: Course(c.course_id, new['name']),
+                update=lambda c, new: self.db_manager.update_course(c.course_id, new['name']),
+                apply_edit=lambda course, edited: course.set_course_name(edited.course_name),
+                delete=self.db_manager.delete_courses,
+                remove=lambda course_id: self.system.remove_course(course_id),
+                dependents=lambda courses: [
+                    (self.student_model, [student for course in courses for student in course.enrolled_students]),
+                    (self.instructor_model, [course.instructor for course in courses if course.instructor])],
+                combos=(self.reg_course_combo, self.assign_course_combo)),
+        ]
+    
+    @staticmethod
+    def _apply_person_edit(person, edited):
+        person.set_name(edited.name)
+        person.age = edited.age
+        person.set_email(edited.get_email())
     
     def save_to_json(self):
         try:
             filename, _ = QFileDialog.getSaveFileName(self, "Save Data", "", 
                                                     "JSON files (*.json);;All files (*.*)")
             if filename:
-                self.system.save_data(filename)
-                QMessageBox.information(self, "Success", "Data saved to JSON successfully")
+                # Snapshot on the GUI thread; the worker only serializes and writes it.
+                self._run_db_task(self._on_json_saved, "Error saving data",
+                                  SchoolManagementSystem.write_data, self.system.to_dict(), filename,
+                                  busy_button=self.save_btn)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error saving data: {str(e)}")
     
+    def _on_json_saved(self, _):
+        QMessageBox.information(self, "Success", "Data saved to JSON successfully")
+    
     def load_from_json(self):
         try:
             filename, _ = QFileDialog.getOpenFileName(self, "Load Data", "", 
                                                     "JSON files (*.json);;All files (*.*)")
             if filename:
-                temp_system = SchoolManagementSystem()
-                if temp_system.load_data(filename):
-                    if self.db_manager.sync_system_to_db(temp_system):
-                        self.refresh_displays()
-                        QMessageBox.information(self, "Success", "Data loaded from JSON and synced to database successfully")
-                    else:
-                        QMessageBox.warning(self, "Error", "Failed to sync data to database")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to load data from JSON")
+                self._run_db_task(self._on_json_loaded, "Error loading data",
+                                  self._load_and_sync, filename, busy_button=self.load_btn)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error loading data: {str(e)}")
     
+    def _load_and_sync(self, filename):
+        """Parse a JSON file into a fresh system and sync it to the database.
+        
+        Runs on the worker thread; the loaded system is only swapped in by
+        :meth:`_on_json_loaded` on the GUI thread.
+        
+        :param filename: Path to the JSON file to load
+        :type filename: str
+        :return: The loaded system, or an error message if loading or syncing failed
+        :rtype: SchoolManagementSystem or str
+        """
+        temp_system = SchoolManagementSystem()
+        if not temp_system.load_data(filename):
+            return "Failed to load data from JSON"
+        if not self.db_manager.sync_system_to_db(temp_system):
+            return "Failed to sync data to database"
+        return temp_system
+    
+    def _loading_json(self):
+        """Warn and return True while a JSON load is running.
+        
+        The load replaces :attr:`system` when it finishes, so changes made in
+        the meantime would be lost. The Load button stays disabled for exactly
+        as long as the load runs (see :meth:`_run_db_task`).
+        
+        :return: True if the caller must not change any data now
+        :rtype: bool
+        """
+        if self.load_btn.isEnabled():
+            return False
+        QMessageBox.warning(self, "Please wait", "Data is still being loaded from JSON")
+        return True
+    
+    def _on_json_loaded(self, result):
+        if isinstance(result, str):
+            QMessageBox.warning(self, "Error", result)
+            return
+        self.system = result
+        self.refresh_displays()
+        QMessageBox.information(self, "Success", "Data loaded from JSON and synced to database successfully")
+    
     def export_to_csv(self):
         try:
             filename, _ = QFileDialog.getSaveFileName(self, "Export to CSV", "", 
                                                     "CSV files (*.csv);;All files (*.*)")
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    writer.writerow(["Type", "Name", "Age", "Email", "ID", "Additional Info"])
-                    
-                    for student in self.system.students:
-                        courses = "; ".join([course.course_name for course in student.registered_courses])
-                        writer.writerow(["Student", student.name, student.age, student.get_email(), 
-                                       student.student_id, f"Courses: {courses}"])
-                    
-                    for instructor in self.system.instructors:
-                        courses = "; ".join([course.course_name for course in instructor.assigned_courses])
-                        writer.writerow(["Instructor", instructor.name, instructor.age, instructor.get_email(), 
-                                       instructor.instructor_id, f"Courses: {courses}"])
-                    
-                    for course in self.system.courses:
-                        instructor_name = course.instructor.name if course.instructor else "None"
-                        students = "; ".join([student.name for student in course.enrolled_students])
-                        writer.writerow(["Course", course.course_name, "", "", course.course_id, 
-                                       f"Instructor: {instructor_name}, Students: {students}"])
-                
-                QMessageBox.information(self, "Success", "Data exported to CSV successfully")
+                # Build the rows on the GUI thread; the worker only writes them.
+                rows = list(chain(self._student_csv_rows(),
+                                  self._instructor_csv_rows(),
+                                  self._course_csv_rows()))
+                self._run_db_task(self._on_csv_exported, "Error exporting data",
+                                  self._write_csv, filename, rows, busy_button=self.export_csv_btn)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting data: {str(e)}")
     
+    @staticmethod
+    def _write_csv(filename, rows):
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            
+            writer.writerow(["Type", "Name", "Age", "Email", "ID", "Additional Info"])
+            writer.writerows(rows)
+    
+    def _on_csv_exported(self, _):
+        QMessageBox.information(self, "Success", "Data exported to CSV successfully")
+    
+    def _student_csv_rows(self):
+        return (("Student", student.name, student.age, student.get_email(), student.student_id,
+                 "Courses: " + "; ".join([course.course_name for course in student.registered_courses]))
+                for student in self.system.students)
+    
+    def _instructor_csv_rows(self):
+        return (("Instructor", instructor.name, instructor.age, instructor.get_email(), instructor.instructor_id,
+                 "Courses: " + "; ".join([course.course_name for course in instructor.assigned_courses]))
+                for instructor in self.system.instructors)
+    
+    def _course_csv_rows(self):
+        return (("Course", course.course_name, "", "", course.course_id,
+                 "Instructor: " + (course.instructor.name if course.instructor else "None")
+                 + ", Students: " + "; ".join([student.name for student in course.enrolled_students]))
+                for course in self.system.courses)
+    
     def export_all_to_csv(self):
         try:
             folder = QFileDialog.getExistingDirectory(self, "Select Folder for CSV Export")
             if folder:
-                tables = ['students', 'instructors', 'courses', 'registrations']
-                for table in tables:
-                    output_path = f"{folder}/{table}.csv"
-                    self.db_manager.export_to_csv(table, output_path)
-                
-                QMessageBox.information(self, "Success", "All tables exported to CSV successfully")
+                self._run_db_task(self._on_tables_exported, "Error exporting tables",
+                                  self._export_tables, folder, busy_button=self.export_all_csv_btn)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting tables: {str(e)}")
     
+    def _export_tables(self, folder):
+        tables = ['students', 'instructors', 'courses', 'registrations']
+        return self.db_manager.export_tables_to_csv(tables, folder)
+    
+    def _on_tables_exported(self, exported):
+        if exported:
+            QMessageBox.information(self, "Success", "All tables exported to CSV successfully")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to export tables to CSV")
+    
     def backup_database(self):
         try:
             filename, _ = QFileDialog.getSaveFileName(self, "Backup Database", "", 
                                                     "Database files (*.db);;All files (*.*)")
             if filename:
-                if self.db_manager.backup_database(filename):
-                    QMessageBox.information(self, "Success", "Database backed up successfully")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to backup database")
+                self._run_db_task(self._on_database_backed_up, "Error backing up database",
+                                  self.db_manager.backup_database, filename,
+                                  busy_button=self.backup_btn)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error backing up database: {str(e)}")
     
+    def _on_database_backed_up(self, backed_up):
+        if backed_up:
+            QMessageBox.information(self, "Success", "Database backed up successfully")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to backup database")
+    
+    def _run_db_task(self, on_finished, error_message, fn, *args, busy_button=None):
+        """Run a blocking database or file call on the worker pool and handle its result on the GUI thread.
+
+        :param on_finished: Slot called with the return value of ``fn``
+        :type on_finished: callable
+        :param error_message: Prefix of the error dialog shown if ``fn`` raises
+        :type error_message: str
+        :param fn: Database or file I/O call to run off the GUI thread
+        :type fn: callable
+        :param args: Positional arguments passed to ``fn``
+        :param busy_button: Button disabled until the call finishes, so it cannot be queued twice
+        :type busy_button: QPushButton, optional
+        """
+        task = DbTask(fn, *args)
+        signals = task.signals
+        if busy_button is not None:
+            busy_button.setEnabled(False)
+            signals.finished.connect(lambda _: busy_button.setEnabled(True))
+            signals.failed.connect(lambda _: busy_button.setEnabled(True))
+        # Keep the signals object alive until the task reports back; the pool
+        # owns (and deletes) the runnable itself.
+        self._pending_tasks.add(signals)
+        signals.finished.connect(on_finished)
+        signals.failed.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"{error_message}: {message}"))
+        signals.finished.connect(lambda _: self._pending_tasks.discard(signals))
+        signals.failed.connect(lambda _: self._pending_tasks.discard(signals))
+        self._thread_pool.start(task)
+    
     def refresh_statistics(self):
         try:
             stats = self.db_manager.get_database_statistics()
@@ -1099,6 +1615,16 @@ Top 5 Popular Courses:
         self.course_id_edit.clear()
         self.course_name_edit.clear()
         self.course_instructor_combo.setCurrentIndex(0)
+    
+    def closeEvent(self, event):
+        """Close the database connection when the window is closed.
+
+        :param event: The close event
+        :type event: QCloseEvent
+        """
+        self._thread_pool.waitForDone()
+        self.db_manager.close()
+        super().closeEvent(event)
 
 
 def main():
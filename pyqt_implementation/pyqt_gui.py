@@ -539,8 +539,7 @@ class SchoolManagementPyQt(QMainWindow):
                                            QMessageBox.Yes | QMessageBox.No)
                 if reply == QMessageBox.No:
                     return
-                if course in course.instructor.assigned_courses:
-                    course.instructor.assigned_courses.remove(course)
+                course.instructor.unassign_course(course)
             
             instructor.assign_course(course)
             self.refresh_displays()
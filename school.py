@@ -17,6 +17,13 @@ from typing import List, Optional, Tuple
 
 _email_re = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
+_GRAM = 3  # search index key length; shorter queries scan the cached fields
+
+
+def _grams(text: str) -> set:
+    """All _GRAM-long substrings of ``text``."""
+    return {text[n:n + _GRAM] for n in range(len(text) - _GRAM + 1)}
+
 
 class Person:
     """Base person with name/age/email."""
@@ -42,11 +49,26 @@ class Student(Person):
             raise ValueError("studentid must not be empty")
         self.studentid = studentid
         self.courses: List["Course"] = []
+        self._coursenames: Optional[str] = None
+
+    @property
+    def coursenames(self) -> str:
+        """Comma-joined course names, cached until the course list changes."""
+        if self._coursenames is None:
+            self._coursenames = ", ".join(c.coursename for c in self.courses)
+        return self._coursenames
 
     def enroll(self, course: "Course") -> None:
         """Link this student to a course if not already linked."""
         if course not in self.courses:
             self.courses.append(course)
+            self._coursenames = None
+
+    def drop(self, course: "Course") -> None:
+        """Unlink this student from a course if linked."""
+        if course in self.courses:
+            self.courses.remove(course)
+            self._coursenames = None
 
 
 class Instructor(Person):
@@ -58,11 +80,26 @@ class Instructor(Person):
             raise ValueError("instructorid must not be empty")
         self.instructorid = instructorid
         self.courses: List["Course"] = []
+        self._coursenames: Optional[str] = None
+
+    @property
+    def coursenames(self) -> str:
+        """Comma-joined course names, cached until the course list changes."""
+        if self._coursenames is None:
+            self._coursenames = ", ".join(c.coursename for c in self.courses)
+        return self._coursenames
 
     def take(self, course: "Course") -> None:
         """Link this instructor to a course if not already linked."""
         if course not in self.courses:
             self.courses.append(course)
+            self._coursenames = None
+
+    def drop(self, course: "Course") -> None:
+        """Unlink this instructor from a course if linked."""
+        if course in self.courses:
+            self.courses.remove(course)
+            self._coursenames = None
 
 
 class Course:
@@ -79,11 +116,26 @@ class Course:
         self.coursename = coursename
         self.instructor: Optional[Instructor] = instructor
         self.students: List[Student] = []
+        self._studentnames: Optional[str] = None
+
+    @property
+    def studentnames(self) -> str:
+        """Comma-joined student names, cached until the student list changes."""
+        if self._studentnames is None:
+            self._studentnames = ", ".join(s.name for s in self.students)
+        return self._studentnames
 
     def addstudent(self, s: Student) -> None:
         """Link this course to a student if not already linked."""
         if s not in self.students:
             self.students.append(s)
+            self._studentnames = None
+
+    def dropstudent(self, s: Student) -> None:
+        """Unlink a student from this course if linked."""
+        if s in self.students:
+            self.students.remove(s)
+            self._studentnames = None
 
 
 class SchoolSystem:
@@ -97,67 +149,80 @@ class SchoolSystem:
         self.students: List[Student] = []
         self.instructors: List[Instructor] = []
         self.courses: List[Course] = []
+        # id -> object indexes, kept in step with the lists by add/remove
+        self._stu_by_id: dict[str, Student] = {}
+        self._inst_by_id: dict[str, Instructor] = {}
+        self._course_by_id: dict[str, Course] = {}
+        # search index, rebuilt lazily after changes (see _searchindex)
+        self._search: Optional[Tuple[list, dict]] = None
 
     # ---------- find ----------
     def findstudent(self, sid: str) -> Optional[Student]:
-        return next((s for s in self.students if s.studentid == sid), None)
+        return self._stu_by_id.get(sid)
 
     def findinstructor(self, iid: str) -> Optional[Instructor]:
-        return next((i for i in self.instructors if i.instructorid == iid), None)
+        return self._inst_by_id.get(iid)
 
     def findcourse(self, cid: str) -> Optional[Course]:
-        return next((c for c in self.courses if c.courseid == cid), None)
+        return self._course_by_id.get(cid)
 
     # ---------- add/remove ----------
     def addstudent(self, s: Student) -> bool:
         """Add a student if id is unique; returns True if added."""
-        if self.findstudent(s.studentid):
+        if s.studentid in self._stu_by_id:
             return False
         self.students.append(s)
+        self._stu_by_id[s.studentid] = s
+        self._search = None
         return True
 
     def addinstructor(self, i: Instructor) -> bool:
-        if self.findinstructor(i.instructorid):
+        if i.instructorid in self._inst_by_id:
             return False
         self.instructors.append(i)
+        self._inst_by_id[i.instructorid] = i
+        self._search = None
         return True
 
     def addcourse(self, c: Course) -> bool:
-        if self.findcourse(c.courseid):
+        if c.courseid in self._course_by_id:
             return False
         self.courses.append(c)
+        self._course_by_id[c.courseid] = c
+        self._search = None
         return True
 
     def removestudent(self, sid: str) -> bool:
-        s = self.findstudent(sid)
+        s = self._stu_by_id.pop(sid, None)
         if not s:
             return False
-        for c in self.courses:
-            if s in c.students:
-                c.students.remove(s)
+        for c in s.courses:
+            c.dropstudent(s)
         self.students.remove(s)
+        self._search = None
         return True
 
     def removeinstructor(self, iid: str) -> bool:
-        i = self.findinstructor(iid)
+        i = self._inst_by_id.pop(iid, None)
         if not i:
             return False
-        for c in self.courses:
-            if c.instructor == i:
+        for c in i.courses:
+            if c.instructor is i:
                 c.instructor = None
         self.instructors.remove(i)
+        self._search = None
         return True
 
     def removecourse(self, cid: str) -> bool:
-        c = self.findcourse(cid)
+        c = self._course_by_id.pop(cid, None)
         if not c:
             return False
-        for s in self.students:
-            if c in s.courses:
-                s.courses.remove(c)
-        if c.instructor and c in c.instructor.courses:
-            c.instructor.courses.remove(c)
+        for s in c.students:
+            s.drop(c)
+        if c.instructor:
+            c.instructor.drop(c)
         self.courses.remove(c)
+        self._search = None
         return True
 
     # ---------- relations ----------
@@ -170,6 +235,7 @@ class SchoolSystem:
             return False
         c.instructor = i
         i.take(c)
+        self._search = None  # instructor name is searchable on the course
         return True
 
     def register(self, sid: str, cid: str) -> bool:
@@ -184,32 +250,60 @@ class SchoolSystem:
         return True
 
     # ---------- search ----------
-    def search(self, q: str) -> List[Tuple[str, str, str, str]]:
-        """Basic search across all entities (case-insensitive)."""
-        q = (q or "").strip().lower()
-        rows: List[Tuple[str, str, str, str]] = []
+    def _searchindex(self) -> Tuple[list, dict]:
+        """Searchable fields per record plus a gram -> record index.
+
+        Entries are ``(type, record, lowered fields)`` in list order; the
+        index maps every _GRAM-long piece of those fields to entry positions.
+        Built on the first search after add/remove/assign.
+        """
+        if self._search is None:
+            entries = []
+            for s in self.students:
+                entries.append(("Student", s, (s.name, s.email, s.studentid)))
+            for i in self.instructors:
+                entries.append(("Instructor", i, (i.name, i.email, i.instructorid)))
+            for c in self.courses:
+                inst_name = c.instructor.name if c.instructor else "None"
+                entries.append(("Course", c, (c.coursename, c.courseid, inst_name)))
+            entries = [(typ, obj, tuple(str(x).lower() for x in fields))
+                       for typ, obj, fields in entries]
+            index: dict[str, set] = {}
+            for n, (_, _, fields) in enumerate(entries):
+                for field in fields:
+                    for g in _grams(field):
+                        index.setdefault(g, set()).add(n)
+            self._search = (entries, index)
+        return self._search
 
-        for s in self.students:
-            if any(q in str(x).lower() for x in (s.name, s.email, s.studentid)):
-                rows.append((
-                    "Student", s.name, s.studentid,
-                    ", ".join(c.coursename for c in s.courses)
-                ))
+    def search(self, q: str) -> List[Tuple[str, str, str, str]]:
+        """Basic search across all entities (case-insensitive).
 
-        for i in self.instructors:
-            if any(q in str(x).lower() for x in (i.name, i.email, i.instructorid)):
-                rows.append((
-                    "Instructor", i.name, i.instructorid,
-                    ", ".join(c.coursename for c in i.courses)
-                ))
+        Matches substrings as before; queries of _GRAM characters or more
+        only check the records holding every piece of the query.
+        """
+        q = (q or "").strip().lower()
+        entries, index = self._searchindex()
+        if len(q) >= _GRAM:
+            postings = sorted((index.get(g, set()) for g in _grams(q)), key=len)
+            candidates = sorted(postings[0].intersection(*postings[1:]))
+        else:
+            candidates = range(len(entries))
 
-        for c in self.courses:
-            inst_name = c.instructor.name if c.instructor else "None"
-            if any(q in str(x).lower() for x in (c.coursename, c.courseid, inst_name)):
+        rows: List[Tuple[str, str, str, str]] = []
+        for n in candidates:
+            typ, obj, fields = entries[n]
+            if not any(q in x for x in fields):
+                continue
+            if typ == "Student":
+                rows.append(("Student", obj.name, obj.studentid, obj.coursenames))
+            elif typ == "Instructor":
+                rows.append(("Instructor", obj.name, obj.instructorid, obj.coursenames))
+            else:
+                inst_name = obj.instructor.name if obj.instructor else "None"
                 rows.append((
-                    "Course", c.coursename, c.courseid,
-                    f"Instructor: {inst_name}; Students: " +
-                    ", ".join(s.name for s in c.students)
+                    "Course", obj.coursename, obj.courseid,
+                    f"Instructor: {inst_name}; Students: " + obj.studentnames
                 ))
         return rows
 
@@ -244,29 +338,22 @@ class SchoolSystem:
     def fromjson(cls, data: dict) -> "SchoolSystem":
         """Build an instance from a dict (links restored both ways)."""
         sysm = cls()
-        sid_map: dict[str, Student] = {}
-        iid_map: dict[str, Instructor] = {}
         # create persons
         for s in data.get("students", []):
-            obj = Student(s["name"], int(s["age"]), s.get("email", ""), s["studentid"])
-            sysm.students.append(obj)
-            sid_map[obj.studentid] = obj
+            sysm.addstudent(Student(s["name"], int(s["age"]), s.get("email", ""), s["studentid"]))
         for i in data.get("instructors", []):
-            obj = Instructor(i["name"], int(i["age"]), i.get("email", ""), i["instructorid"])
-            sysm.instructors.append(obj)
-            iid_map[obj.instructorid] = obj
+            sysm.addinstructor(Instructor(i["name"], int(i["age"]), i.get("email", ""), i["instructorid"]))
         # create courses (instructor linked later)
         for c in data.get("courses", []):
-            inst = iid_map.get(c.get("instructor")) if c.get("instructor") else None
+            inst = sysm.findinstructor(c.get("instructor")) if c.get("instructor") else None
             obj = Course(c["courseid"], c["coursename"], inst)
-            sysm.courses.append(obj)
-            if inst:
+            if sysm.addcourse(obj) and inst:
                 inst.take(obj)
         # link students <-> courses
         for c in data.get("courses", []):
             course = sysm.findcourse(c["courseid"])
             for sid in c.get("students", []):
-                s = sid_map.get(sid)
+                s = sysm.findstudent(sid)
                 if s and course:
                     course.addstudent(s)
                     s.enroll(course)
@@ -282,5 +369,10 @@ class SchoolSystem:
             return cls()
     def save(self, path: str) -> None:
         """Write current state to the JSON file."""
+        self.writejson(self.tojson(), path)
+
+    @staticmethod
+    def writejson(data: dict, path: str) -> None:
+        """Write a tojson() snapshot to the JSON file."""
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.tojson(), f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, indent=2)
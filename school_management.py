@@ -9,6 +9,11 @@ import json
 import re
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Person:
     """Base class representing a person in the school management system.
@@ -25,6 +30,10 @@ class Person:
     :raises ValueError: If any parameter fails validation
     """
     
+    __slots__ = ('name', 'age', '_email')
+    
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    
     def __init__(self, name: str, age: int, email: str):
         if not self._validate_name(name):
             raise ValueError("Name must be a non-empty string")
@@ -54,18 +63,20 @@ class Person:
         :return: True if name is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(name, str) and len(name.strip()) > 0
+        return type(name) is str and bool(name) and not name.isspace()
     
     @staticmethod
     def _validate_age(age: int) -> bool:
         """Validate that age is a non-negative integer.
         
+        Booleans are rejected even though ``bool`` subclasses ``int``.
+        
         :param age: The age to validate
         :type age: int
         :return: True if age is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(age, int) and age >= 0
+        return type(age) is int and age >= 0
     
     @staticmethod
     def _validate_email(email: str) -> bool:
@@ -79,8 +90,7 @@ class Person:
         :return: True if email format is valid, False otherwise
         :rtype: bool
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return isinstance(email, str) and re.match(pattern, email) is not None
+        return type(email) is str and Person._EMAIL_RE.match(email) is not None
     
     def get_email(self):
         """Get the person's email address.
@@ -90,6 +100,17 @@ class Person:
         """
         return self._email
     
+    def set_name(self, name: str):
+        """Set a new name for the person.
+        
+        :param name: The new name
+        :type name: str
+        :raises ValueError: If the name is not a non-empty string
+        """
+        if not self._validate_name(name):
+            raise ValueError("Name must be a non-empty string")
+        self.name = name
+    
     def set_email(self, email: str):
         """Set a new email address for the person.
         
@@ -122,14 +143,58 @@ class Student(Person):
     :vartype student_id: str
     :ivar registered_courses: List of courses the student is registered for
     :vartype registered_courses: List[Course]
+    
+    Registrations should go through :meth:`register_course` and
+    :meth:`unregister_course`. They keep an insertion-ordered dict of the
+    registered course IDs in sync with the list; it is used for duplicate
+    checks and by :meth:`to_dict`. The joined course names returned by
+    :attr:`registered_course_names` are cached until the registrations or a
+    course name change.
     """
     
+    __slots__ = ('student_id', 'registered_courses', '_course_ids', '_course_names')
+    
     def __init__(self, name: str, age: int, email: str, student_id: str):
         super().__init__(name, age, email)
         if not self._validate_student_id(student_id):
             raise ValueError("Student ID must be a non-empty string")
         self.student_id = student_id
         self.registered_courses = []
+        self._course_ids = {}
+        self._course_names = None
+    
+    @classmethod
+    def _from_validated(cls, name: str, age: int, email: str, student_id: str):
+        """Create a student from values that have already been validated.
+        
+        Skips the constructor's checks; used by bulk loaders that validate
+        all of their input up front.
+        
+        :return: The new student
+        :rtype: Student
+        """
+        student = cls.__new__(cls)
+        student.name = name
+        student.age = age
+        student._email = email
+        student.student_id = student_id
+        student.registered_courses = []
+        student._course_ids = {}
+        student._course_names = None
+        return student
+    
+    def __eq__(self, other):
+        """Compare students by their ID.
+        
+        Two Student objects describing the same student are equal even if they
+        were created separately, e.g. by two loads of the same data.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.student_id == other.student_id
+    
+    def __hash__(self):
+        return hash(self.student_id)
     
     def register_course(self, course):
         """Register the student for a course.
@@ -141,10 +206,62 @@ class Student(Person):
         :param course: The course to register for
         :type course: Course
         """
-        if course not in self.registered_courses:
+        if course.course_id not in self._course_ids:
+            self._course_ids[course.course_id] = None
             self.registered_courses.append(course)
+            self._course_names = None
             course.add_student(self)
     
+    def unregister_course(self, course):
+        """Unregister the student from a course.
+        
+        Removes the course from the student's registered courses list and
+        the student from the course's enrolled students list.
+        
+        :param course: The course to unregister from
+        :type course: Course
+        """
+        if course.course_id in self._course_ids:
+            del self._course_ids[course.course_id]
+            self.registered_courses.remove(course)
+            self._course_names = None
+            course.remove_student(self)
+    
+    def is_registered(self, course) -> bool:
+        """Check whether the student is registered for a course.
+        
+        :param course: The course to check
+        :type course: Course
+        :return: True if the course is in the student's registered courses
+        :rtype: bool
+        """
+        return course.course_id in self._course_ids
+    
+    @property
+    def registered_course_names(self) -> str:
+        """Comma-separated names of the registered courses, in registration order.
+        
+        :return: The joined course names
+        :rtype: str
+        """
+        if self._course_names is None:
+            self._course_names = ", ".join([course.course_name for course in self.registered_courses])
+        return self._course_names
+    
+    def set_name(self, name: str):
+        """Set a new name for the student.
+        
+        Also drops the cached student names of the courses the student is
+        registered for.
+        
+        :param name: The new name
+        :type name: str
+        :raises ValueError: If the name is not a non-empty string
+        """
+        super().set_name(name)
+        for course in self.registered_courses:
+            course._student_names = None
+    
     @staticmethod
     def _validate_student_id(student_id: str) -> bool:
         """Validate that a student ID is a non-empty string.
@@ -154,7 +271,7 @@ class Student(Person):
         :return: True if student ID is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(student_id, str) and len(student_id.strip()) > 0
+        return type(student_id) is str and bool(student_id) and not student_id.isspace()
     
     def to_dict(self):
         """Convert student object to dictionary representation.
@@ -170,7 +287,7 @@ class Student(Person):
             'age': self.age,
             'email': self._email,
             'student_id': self.student_id,
-            'registered_courses': [course.course_id for course in self.registered_courses]
+            'registered_courses': list(self._course_ids)
         }
 
 
@@ -194,14 +311,58 @@ class Instructor(Person):
     :vartype instructor_id: str
     :ivar assigned_courses: List of courses assigned to the instructor
     :vartype assigned_courses: List[Course]
+    
+    Assignments should go through :meth:`assign_course` and
+    :meth:`unassign_course`. They keep an insertion-ordered dict of the
+    assigned course IDs in sync with the list; it is used for duplicate
+    checks and by :meth:`to_dict`. The joined course names returned by
+    :attr:`assigned_course_names` are cached until the assignments or a
+    course name change.
     """
     
+    __slots__ = ('instructor_id', 'assigned_courses', '_course_ids', '_course_names')
+    
     def __init__(self, name: str, age: int, email: str, instructor_id: str):
         super().__init__(name, age, email)
         if not self._validate_instructor_id(instructor_id):
             raise ValueError("Instructor ID must be a non-empty string")
         self.instructor_id = instructor_id
         self.assigned_courses = []
+        self._course_ids = {}
+        self._course_names = None
+    
+    @classmethod
+    def _from_validated(cls, name: str, age: int, email: str, instructor_id: str):
+        """Create an instructor from values that have already been validated.
+        
+        Skips the constructor's checks; used by bulk loaders that validate
+        all of their input up front.
+        
+        :return: The new instructor
+        :rtype: Instructor
+        """
+        instructor = cls.__new__(cls)
+        instructor.name = name
+        instructor.age = age
+        instructor._email = email
+        instructor.instructor_id = instructor_id
+        instructor.assigned_courses = []
+        instructor._course_ids = {}
+        instructor._course_names = None
+        return instructor
+    
+    def __eq__(self, other):
+        """Compare instructors by their ID.
+        
+        Two Instructor objects describing the same instructor are equal even if they
+        were created separately, e.g. by two loads of the same data.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.instructor_id == other.instructor_id
+    
+    def __hash__(self):
+        return hash(self.instructor_id)
     
     def assign_course(self, course):
         """Assign a course to the instructor.
@@ -213,10 +374,39 @@ class Instructor(Person):
         :param course: The course to assign
         :type course: Course
         """
-        if course not in self.assigned_courses:
+        if course.course_id not in self._course_ids:
+            self._course_ids[course.course_id] = None
             self.assigned_courses.append(course)
+            self._course_names = None
             course.instructor = self
     
+    def unassign_course(self, course):
+        """Remove a course from the instructor's assignments.
+        
+        Removes the course from the instructor's assigned courses list and
+        clears the course's instructor if it is this instructor.
+        
+        :param course: The course to unassign
+        :type course: Course
+        """
+        if course.course_id in self._course_ids:
+            del self._course_ids[course.course_id]
+            self.assigned_courses.remove(course)
+            self._course_names = None
+        if course.instructor is self:
+            course.instructor = None
+    
+    @property
+    def assigned_course_names(self) -> str:
+        """Comma-separated names of the assigned courses, in assignment order.
+        
+        :return: The joined course names
+        :rtype: str
+        """
+        if self._course_names is None:
+            self._course_names = ", ".join([course.course_name for course in self.assigned_courses])
+        return self._course_names
+    
     @staticmethod
     def _validate_instructor_id(instructor_id: str) -> bool:
         """Validate that an instructor ID is a non-empty string.
@@ -226,7 +416,7 @@ class Instructor(Person):
         :return: True if instructor ID is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(instructor_id, str) and len(instructor_id.strip()) > 0
+        return type(instructor_id) is str and bool(instructor_id) and not instructor_id.isspace()
     
     def to_dict(self):
         """Convert instructor object to dictionary representation.
@@ -242,7 +432,7 @@ class Instructor(Person):
             'age': self.age,
             'email': self._email,
             'instructor_id': self.instructor_id,
-            'assigned_courses': [course.course_id for course in self.assigned_courses]
+            'assigned_courses': list(self._course_ids)
         }
 
 
@@ -269,8 +459,18 @@ class Course:
     :vartype instructor: Instructor or None
     :ivar enrolled_students: List of students enrolled in the course
     :vartype enrolled_students: List[Student]
+    
+    Enrollments should go through :meth:`add_student` and
+    :meth:`remove_student`. They keep an insertion-ordered dict of the
+    enrolled student IDs in sync with the list; it is used for duplicate
+    checks and by :meth:`to_dict`. The joined student names returned by
+    :attr:`enrolled_student_names` are cached until the enrollment or a
+    student name change; rename courses with :meth:`set_course_name` so the
+    course name caches of their students and instructor are dropped too.
     """
     
+    __slots__ = ('course_id', 'course_name', 'instructor', 'enrolled_students', '_student_ids', '_student_names')
+    
     def __init__(self, course_id: str, course_name: str, instructor=None):
         if not self._validate_course_id(course_id):
             raise ValueError("Course ID must be a non-empty string")
@@ -281,6 +481,40 @@ class Course:
         self.course_name = course_name
         self.instructor = instructor
         self.enrolled_students = []
+        self._student_ids = {}
+        self._student_names = None
+    
+    @classmethod
+    def _from_validated(cls, course_id: str, course_name: str, instructor=None):
+        """Create a course from values that have already been validated.
+        
+        Skips the constructor's checks; used by bulk loaders that validate
+        all of their input up front.
+        
+        :return: The new course
+        :rtype: Course
+        """
+        course = cls.__new__(cls)
+        course.course_id = course_id
+        course.course_name = course_name
+        course.instructor = instructor
+        course.enrolled_students = []
+        course._student_ids = {}
+        course._student_names = None
+        return course
+    
+    def __eq__(self, other):
+        """Compare courses by their ID.
+        
+        Two Course objects describing the same course are equal even if they
+        were created separately, e.g. by two loads of the same data.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.course_id == other.course_id
+    
+    def __hash__(self):
+        return hash(self.course_id)
     
     def add_student(self, student):
         """Add a student to the course enrollment.
@@ -291,8 +525,50 @@ class Course:
         :param student: The student to enroll
         :type student: Student
         """
-        if student not in self.enrolled_students:
+        if student.student_id not in self._student_ids:
+            self._student_ids[student.student_id] = None
             self.enrolled_students.append(student)
+            self._student_names = None
+    
+    def remove_student(self, student):
+        """Remove a student from the course enrollment.
+        
+        :param student: The student to remove
+        :type student: Student
+        """
+        if student.student_id in self._student_ids:
+            del self._student_ids[student.student_id]
+            self.enrolled_students.remove(student)
+            self._student_names = None
+    
+    @property
+    def enrolled_student_names(self) -> str:
+        """Comma-separated names of the enrolled students, in enrollment order.
+        
+        :return: The joined student names
+        :rtype: str
+        """
+        if self._student_names is None:
+            self._student_names = ", ".join([student.name for student in self.enrolled_students])
+        return self._student_names
+    
+    def set_course_name(self, course_name: str):
+        """Set a new name for the course.
+        
+        Also drops the cached course names of the enrolled students and of
+        the assigned instructor.
+        
+        :param course_name: The new course name
+        :type course_name: str
+        :raises ValueError: If the course name is not a non-empty string
+        """
+        if not self._validate_course_name(course_name):
+            raise ValueError("Course name must be a non-empty string")
+        self.course_name = course_name
+        for student in self.enrolled_students:
+            student._course_names = None
+        if self.instructor is not None:
+            self.instructor._course_names = None
     
     @staticmethod
     def _validate_course_id(course_id: str) -> bool:
@@ -303,7 +579,7 @@ class Course:
         :return: True if course ID is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(course_id, str) and len(course_id.strip()) > 0
+        return type(course_id) is str and bool(course_id) and not course_id.isspace()
     
     @staticmethod
     def _validate_course_name(course_name: str) -> bool:
@@ -314,7 +590,7 @@ class Course:
         :return: True if course name is valid, False otherwise
         :rtype: bool
         """
-        return isinstance(course_name, str) and len(course_name.strip()) > 0
+        return type(course_name) is str and bool(course_name) and not course_name.isspace()
     
     def to_dict(self):
         """Convert course object to dictionary representation.
@@ -329,7 +605,7 @@ class Course:
             'course_id': self.course_id,
             'course_name': self.course_name,
             'instructor_id': self.instructor.instructor_id if self.instructor else None,
-            'enrolled_students': [student.student_id for student in self.enrolled_students]
+            'enrolled_students': list(self._student_ids)
         }
 
 
@@ -345,12 +621,18 @@ class SchoolManagementSystem:
     :vartype instructors: List[Instructor]
     :ivar courses: List of all courses in the system
     :vartype courses: List[Course]
+    
+    The lists keep insertion order for display; ID lookups go through
+    dictionaries that the add/remove methods keep in sync with them.
     """
     
     def __init__(self):
         self.students = []
         self.instructors = []
         self.courses = []
+        self._students_by_id = {}
+        self._instructors_by_id = {}
+        self._courses_by_id = {}
     
     def add_student(self, student: Student):
         """Add a student to the school management system.
@@ -359,6 +641,7 @@ class SchoolManagementSystem:
         :type student: Student
         """
         self.students.append(student)
+        self._students_by_id.setdefault(student.student_id, student)
     
     def add_instructor(self, instructor: Instructor):
         """Add an instructor to the school management system.
@@ -367,6 +650,7 @@ class SchoolManagementSystem:
         :type instructor: Instructor
         """
         self.instructors.append(instructor)
+        self._instructors_by_id.setdefault(instructor.instructor_id, instructor)
     
     def add_course(self, course: Course):
         """Add a course to the school management system.
@@ -375,6 +659,7 @@ class SchoolManagementSystem:
         :type course: Course
         """
         self.courses.append(course)
+        self._courses_by_id.setdefault(course.course_id, course)
     
     def find_student_by_id(self, student_id: str):
         """Find a student by their unique student ID.
@@ -384,7 +669,7 @@ class SchoolManagementSystem:
         :return: The student object if found, None otherwise
         :rtype: Student or None
         """
-        return next((s for s in self.students if s.student_id == student_id), None)
+        return self._students_by_id.get(student_id)
     
     def find_instructor_by_id(self, instructor_id: str):
         """Find an instructor by their unique instructor ID.
@@ -394,7 +679,7 @@ class SchoolManagementSystem:
         :return: The instructor object if found, None otherwise
         :rtype: Instructor or None
         """
-        return next((i for i in self.instructors if i.instructor_id == instructor_id), None)
+        return self._instructors_by_id.get(instructor_id)
     
     def find_course_by_id(self, course_id: str):
         """Find a course by its unique course ID.
@@ -404,7 +689,22 @@ class SchoolManagementSystem:
         :return: The course object if found, None otherwise
         :rtype: Course or None
         """
-        return next((c for c in self.courses if c.course_id == course_id), None)
+        return self._courses_by_id.get(course_id)
+    
+    def to_dict(self) -> dict:
+        """Snapshot all students, instructors, and courses as JSON-ready data.
+        
+        The result shares no lists with the system, so it can be written by
+        :meth:`write_data` on another thread while the system keeps changing.
+        
+        :return: Dictionary with 'students', 'instructors' and 'courses' lists
+        :rtype: dict
+        """
+        return {
+            'students': [student.to_dict() for student in self.students],
+            'instructors': [instructor.to_dict() for instructor in self.instructors],
+            'courses': [course.to_dict() for course in self.courses]
+        }
     
     def save_data(self, filename: str = "school_data.json"):
         """Save all system data to a JSON file.
@@ -415,20 +715,34 @@ class SchoolManagementSystem:
         :param filename: Path to the output JSON file, defaults to "school_data.json"
         :type filename: str, optional
         """
-        data = {
-            'students': [student.to_dict() for student in self.students],
-            'instructors': [instructor.to_dict() for instructor in self.instructors],
-            'courses': [course.to_dict() for course in self.courses]
-        }
+        self.write_data(self.to_dict(), filename)
+    
+    @staticmethod
+    def write_data(data: dict, filename: str = "school_data.json"):
+        """Write a :meth:`to_dict` snapshot to a JSON file.
+        
+        Uses orjson when it is installed and the standard json module otherwise;
+        both write the same two-space indented layout.
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        :param data: Snapshot returned by :meth:`to_dict`
+        :type data: dict
+        :param filename: Path to the output JSON file, defaults to "school_data.json"
+        :type filename: str, optional
+        """
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
     
     def load_data(self, filename: str = "school_data.json"):
         """Load system data from a JSON file.
         
         Deserializes students, instructors, and courses from a JSON file
         and reconstructs all object relationships. Replaces current system state.
+        Every record is validated before any object is built, so a file with an
+        invalid record is rejected as a whole and the current state is kept.
         
         :param filename: Path to the input JSON file, defaults to "school_data.json"
         :type filename: str, optional
@@ -436,28 +750,50 @@ class SchoolManagementSystem:
         :rtype: bool
         """
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            # The raw bytes are parsed without keeping a reference to them, and
+            # each section's records are released once its objects are built,
+            # so the file contents and the parsed records are not all kept
+            # alive alongside the finished object graph.
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.loads(f.read())
+            
+            instructor_records = data.pop('instructors', [])
+            course_records = data.pop('courses', [])
+            student_records = data.pop('students', [])
+            del data
+            self._validate_person_records(instructor_records, 'instructor_id',
+                                          "Instructor ID must be a non-empty string")
+            self._validate_course_records(course_records)
+            self._validate_person_records(student_records, 'student_id',
+                                          "Student ID must be a non-empty string")
             
             self.students = []
             self.instructors = []
             self.courses = []
+            self._students_by_id = {}
+            self._instructors_by_id = {}
+            self._courses_by_id = {}
+            # Bound once for the loops below; resolving every reference
+            # through find_*_by_id would add a method call per lookup.
+            instructors_by_id = self._instructors_by_id
+            courses_by_id = self._courses_by_id
             
-            for instructor_data in data.get('instructors', []):
-                instructor = Instructor(
+            for instructor_data in instructor_records:
+                instructor = Instructor._from_validated(
                     instructor_data['name'],
                     instructor_data['age'],
                     instructor_data['email'],
                     instructor_data['instructor_id']
                 )
                 self.add_instructor(instructor)
+            del instructor_records
             
-            for course_data in data.get('courses', []):
+            for course_data in course_records:
                 instructor = None
                 if course_data.get('instructor_id'):
-                    instructor = self.find_instructor_by_id(course_data['instructor_id'])
+                    instructor = instructors_by_id.get(course_data['instructor_id'])
                 
-                course = Course(
+                course = Course._from_validated(
                     course_data['course_id'],
                     course_data['course_name'],
                     instructor
@@ -466,9 +802,10 @@ class SchoolManagementSystem:
                 
                 if instructor:
                     instructor.assign_course(course)
+            del course_records
             
-            for student_data in data.get('students', []):
-                student = Student(
+            for student_data in student_records:
+                student = Student._from_validated(
                     student_data['name'],
                     student_data['age'],
                     student_data['email'],
@@ -476,10 +813,16 @@ class SchoolManagementSystem:
                 )
                 self.add_student(student)
                 
-                for course_id in student_data.get('registered_courses', []):
-                    course = self.find_course_by_id(course_id)
-                    if course:
-                        student.register_course(course)
+                # Fill the student's side in one go from the de-duplicated,
+                # resolvable course IDs, then add the student to each course.
+                course_ids = [
+                    course_id for course_id in dict.fromkeys(student_data.get('registered_courses', []))
+                    if course_id in courses_by_id
+                ]
+                student._course_ids = dict.fromkeys(course_ids)
+                student.registered_courses = [courses_by_id[course_id] for course_id in course_ids]
+                for course in student.registered_courses:
+                    course.add_student(student)
             
             return True
         except FileNotFoundError:
@@ -488,6 +831,53 @@ class SchoolManagementSystem:
             print(f"Error loading data: {e}")
             return False
     
+    @staticmethod
+    def _validate_person_records(records: List[Dict[str, Any]], id_key: str, id_message: str):
+        """Validate a list of student or instructor records in one pass.
+        
+        Applies the same rules as the Person constructors, with the checks
+        inlined so that a large file is not validated through several method
+        calls per record.
+        
+        :param records: Records as read from the data file
+        :type records: List[Dict[str, Any]]
+        :param id_key: Key holding the record's ID
+        :type id_key: str
+        :param id_message: Error message for an invalid ID
+        :type id_message: str
+        :raises ValueError: If any record fails validation
+        """
+        email_match = Person._EMAIL_RE.match
+        for record in records:
+            name = record['name']
+            age = record['age']
+            email = record['email']
+            record_id = record[id_key]
+            if not (type(name) is str and name and not name.isspace()):
+                raise ValueError("Name must be a non-empty string")
+            if not (type(age) is int and age >= 0):
+                raise ValueError("Age must be a non-negative integer")
+            if not (type(email) is str and email_match(email)):
+                raise ValueError("Invalid email format")
+            if not (type(record_id) is str and record_id and not record_id.isspace()):
+                raise ValueError(id_message)
+    
+    @staticmethod
+    def _validate_course_records(records: List[Dict[str, Any]]):
+        """Validate a list of course records in one pass.
+        
+        :param records: Records as read from the data file
+        :type records: List[Dict[str, Any]]
+        :raises ValueError: If any record fails validation
+        """
+        for record in records:
+            course_id = record['course_id']
+            course_name = record['course_name']
+            if not (type(course_id) is str and course_id and not course_id.isspace()):
+                raise ValueError("Course ID must be a non-empty string")
+            if not (type(course_name) is str and course_name and not course_name.isspace()):
+                raise ValueError("Course name must be a non-empty string")
+    
     def remove_student(self, student_id: str):
         """Remove a student from the system by ID.
         
@@ -501,10 +891,10 @@ class SchoolManagementSystem:
         """
         student = self.find_student_by_id(student_id)
         if student:
-            for course in student.registered_courses[:]:
-                if student in course.enrolled_students:
-                    course.enrolled_students.remove(student)
+            for course in student.registered_courses:
+                course.remove_student(student)
             self.students.remove(student)
+            del self._students_by_id[student_id]
             return True
         return False
     
@@ -521,9 +911,10 @@ class SchoolManagementSystem:
         """
         instructor = self.find_instructor_by_id(instructor_id)
         if instructor:
-            for course in instructor.assigned_courses[:]:
+            for course in instructor.assigned_courses:
                 course.instructor = None
             self.instructors.remove(instructor)
+            del self._instructors_by_id[instructor_id]
             return True
         return False
     
@@ -540,12 +931,22 @@ class SchoolManagementSystem:
         """
         course = self.find_course_by_id(course_id)
         if course:
-            for student in course.enrolled_students[:]:
-                if course in student.registered_courses:
+            # Detach the course from each student directly and then empty the
+            # course's own enrollment once, instead of removing the students
+            # from it one at a time.
+            # Course.add_student can link a student from the course side only,
+            # so the student may not list the course.
+            for student in course.enrolled_students:
+                if course_id in student._course_ids:
+                    del student._course_ids[course_id]
                     student.registered_courses.remove(course)
+                    student._course_names = None
+            course.enrolled_students.clear()
+            course._student_ids.clear()
+            course._student_names = None
             if course.instructor:
-                if course in course.instructor.assigned_courses:
-                    course.instructor.assigned_courses.remove(course)
+                course.instructor.unassign_course(course)
             self.courses.remove(course)
+            del self._courses_by_id[course_id]
             return True
         return False
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 Store facade wrapping SchoolSystem.
 
-- Always saves after a successful change.
+- Saves after every successful change, or with autosave off marks
+  itself dirty so the caller can batch saves.
 - Adds CSV export for quick grading checks.
 """
 
@@ -14,61 +15,64 @@ class SchoolStore:
     """Data access layer.
 
     :param jsonpath: file used for persistence (default: school_data.json)
+    :param autosave: save after each change; if False only set ``dirty``
     """
 
-    def __init__(self, jsonpath: str = "school_data.json"):
+    def __init__(self, jsonpath: str = "school_data.json", autosave: bool = True):
         self.jsonpath = jsonpath
+        self.autosave = autosave
+        self.dirty = False
         self.system: SchoolSystem = SchoolSystem.load(jsonpath)
 
     # ----- create -----
     def addstudent(self, s: Student) -> bool:
         ok = self.system.addstudent(s)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     def addinstructor(self, i: Instructor) -> bool:
         ok = self.system.addinstructor(i)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     def addcourse(self, c: Course) -> bool:
         ok = self.system.addcourse(c)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     # ----- delete -----
     def removestudent(self, sid: str) -> bool:
         ok = self.system.removestudent(sid)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     def removeinstructor(self, iid: str) -> bool:
         ok = self.system.removeinstructor(iid)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     def removecourse(self, cid: str) -> bool:
         ok = self.system.removecourse(cid)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     # ----- relations -----
     def assigncourse(self, iid: str, cid: str) -> bool:
         ok = self.system.assign(iid, cid)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     def joincourse(self, sid: str, cid: str) -> bool:
         ok = self.system.register(sid, cid)
         if ok:
-            self.save()
+            self.markchanged()
         return ok
 
     # ----- search + export -----
@@ -81,19 +85,17 @@ class SchoolStore:
         rows = []
         for s in self.system.students:
             rows.append([
-                "Student", s.name, s.age, s.email, s.studentid,
-                ", ".join(c.coursename for c in s.courses),
+                "Student", s.name, s.age, s.email, s.studentid, s.coursenames,
             ])
         for i in self.system.instructors:
             rows.append([
-                "Instructor", i.name, i.age, i.email, i.instructorid,
-                ", ".join(c.coursename for c in i.courses),
+                "Instructor", i.name, i.age, i.email, i.instructorid, i.coursenames,
             ])
         for c in self.system.courses:
             rows.append([
                 "Course", c.coursename, "", "", c.courseid,
                 "Instructor: " + (c.instructor.name if c.instructor else "None") +
-                " | Students: " + ", ".join(s.name for s in c.students),
+                " | Students: " + c.studentnames,
             ])
 
         with open(path, "w", newline="", encoding="utf-8") as f:
@@ -102,5 +104,20 @@ class SchoolStore:
             w.writerows(rows)
 
     # ----- save -----
+    def markchanged(self) -> None:
+        """Record a change made to the system: save now or mark dirty."""
+        if self.autosave:
+            self.save()
+        else:
+            self.dirty = True
+
     def save(self) -> None:
         self.system.save(self.jsonpath)
+        self.dirty = False
+
+    def write(self, data: dict) -> None:
+        """Write a snapshot taken with ``system.tojson()``; safe off the UI thread.
+
+        Leaves ``dirty`` alone; the caller owns it and handles failures.
+        """
+        SchoolSystem.writejson(data, self.jsonpath)
@@ -10,11 +10,16 @@ Uses SchoolStore for persistence (JSON) and export (CSV).
 """
 
 from __future__ import annotations
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from school import Student, Instructor, Course
 from store import SchoolStore
 
+SEARCH_DELAY_MS = 120  # wait for a typing pause before searching
+SAVE_DELAY_MS = 250  # coalesce JSON saves from changes made close together
+SAVE_POLL_MS = 100  # how often the Tk thread checks on a background save
+
 
 class TkApp(ttk.Frame):
     """Main Tk application placed inside a root window."""
@@ -24,10 +29,23 @@ class TkApp(ttk.Frame):
         master.title("School Manager (Tk)")
         master.geometry("950x600")
         self.pack(fill="both", expand=True)
+        master.protocol("WM_DELETE_WINDOW", self.close)
 
-        # data access
-        self.store = SchoolStore()
+        # data access (saved in the background, see _flush_store)
+        self.store = SchoolStore(autosave=False)
         self.sys = self.store.system
+        self._save_after: str | None = None
+        self._save_thread: threading.Thread | None = None
+        # set by the save worker, read on the Tk thread once it has finished
+        self._save_error: Exception | None = None
+        self._save_failing = False  # last save failed and was reported
+        # last values shown per tree, keyed by row iid (see _fill)
+        self._shown: dict[ttk.Treeview, dict[str, tuple]] = {}
+        # pending debounced search and the query it last ran with
+        self._search_after: str | None = None
+        self._last_q: str | None = None
+        # combobox labels last pushed to Tk, per entity kind
+        self._combo_cache: dict[str, list[str]] = {}
 
         # notebook with three pages
         self.tabs = ttk.Notebook(self)
@@ -171,7 +189,7 @@ class TkApp(ttk.Frame):
         ttk.Label(top, text="Search").pack(side="left", padx=6)
         self.q = ttk.Entry(top, width=50)
         self.q.pack(side="left")
-        self.q.bind("<KeyRelease>", lambda e: self.dosearch())
+        self.q.bind("<KeyRelease>", lambda e: self._queuesearch())
 
         cols = ("typ", "name", "code", "info")
         self.t_search = ttk.Treeview(v, columns=cols, show="headings", selectmode="browse")
@@ -223,7 +241,7 @@ class TkApp(ttk.Frame):
                 return
             if inst:
                 inst.take(c)
-                self.store.save()  # keep both sides in JSON
+                self.store.markchanged()  # keep both sides in JSON
             self.cid.delete(0, "end")
             self.cname.delete(0, "end")
             self.cinst.set("")
@@ -267,69 +285,168 @@ class TkApp(ttk.Frame):
     def deleteselected(self) -> None:
         """Delete the selected row from the active table."""
         tab = self.viewtabs.index(self.viewtabs.select())
+        # row iids are the record ids (see refresh)
         if tab == 0:
             sel = self.t_students.selection()
-            if sel:
-                sid = self.t_students.item(sel[0])["values"][3]
-                if self.store.removestudent(sid):
-                    self.refresh()
+            if sel and self.store.removestudent(sel[0]):
+                self.refresh()
         elif tab == 1:
             sel = self.t_insts.selection()
-            if sel:
-                iid = self.t_insts.item(sel[0])["values"][3]
-                if self.store.removeinstructor(iid):
-                    self.refresh()
+            if sel and self.store.removeinstructor(sel[0]):
+                self.refresh()
         else:
             sel = self.t_courses.selection()
-            if sel:
-                cid = self.t_courses.item(sel[0])["values"][0]
-                if self.store.removecourse(cid):
-                    self.refresh()
+            if sel and self.store.removecourse(sel[0]):
+                self.refresh()
 
     def refresh(self) -> None:
         """Refill form combos and tables then run a search refresh."""
-        # combos
-        self.cinst["values"] = [""] + [f"{i.instructorid} - {i.name}" for i in self.sys.instructors]
-        self.rsid["values"] = [f"{s.studentid} - {s.name}" for s in self.sys.students]
-        self.rcid["values"] = [f"{c.courseid} - {c.coursename}" for c in self.sys.courses]
-        self.aiid["values"] = [f"{i.instructorid} - {i.name}" for i in self.sys.instructors]
-        self.acid["values"] = [f"{c.courseid} - {c.coursename}" for c in self.sys.courses]
-
-        # tables
-        def fill(tree: ttk.Treeview, rows: list[list[str]]) -> None:
-            for iid in tree.get_children():
-                tree.delete(iid)
-            for r in rows:
-                tree.insert("", "end", values=r)
-
-        fill(self.t_students, [
-            [s.name, s.age, s.email, s.studentid,
-             ", ".join(c.coursename for c in s.courses)]
+        # every action refreshes after changing data, so queue its save here
+        if self.store.dirty and self._save_after is None:
+            self._save_after = self.after(SAVE_DELAY_MS, self._flush_store)
+
+        # combos (only re-sent to Tk when their labels changed)
+        insts = [f"{i.instructorid} - {i.name}" for i in self.sys.instructors]
+        if self._combo_cache.get("inst") != insts:
+            self.cinst["values"] = [""] + insts
+            self.aiid["values"] = insts
+            self._combo_cache["inst"] = insts
+        studs = [f"{s.studentid} - {s.name}" for s in self.sys.students]
+        if self._combo_cache.get("stud") != studs:
+            self.rsid["values"] = studs
+            self._combo_cache["stud"] = studs
+        courses = [f"{c.courseid} - {c.coursename}" for c in self.sys.courses]
+        if self._combo_cache.get("course") != courses:
+            self.rcid["values"] = courses
+            self.acid["values"] = courses
+            self._combo_cache["course"] = courses
+
+        # tables (rows keyed by id so only changed rows are touched)
+        self._fill(self.t_students, {
+            s.studentid: (s.name, s.age, s.email, s.studentid, s.coursenames)
             for s in self.sys.students
-        ])
-        fill(self.t_insts, [
-            [i.name, i.age, i.email, i.instructorid,
-             ", ".join(c.coursename for c in i.courses)]
+        })
+        self._fill(self.t_insts, {
+            i.instructorid: (i.name, i.age, i.email, i.instructorid, i.coursenames)
             for i in self.sys.instructors
-        ])
-        fill(self.t_courses, [
-            [c.courseid, c.coursename,
-             (c.instructor.name if c.instructor else "None"),
-             ", ".join(s.name for s in c.students)]
+        })
+        self._fill(self.t_courses, {
+            c.courseid: (c.courseid, c.coursename,
+                         (c.instructor.name if c.instructor else "None"),
+                         c.studentnames)
             for c in self.sys.courses
-        ])
+        })
 
         # search page refresh
         self.dosearch()
 
+    def _flush_store(self) -> None:
+        """Write pending changes to JSON on a worker thread.
+
+        The snapshot is taken here on the Tk thread; only the JSON dump and
+        file write run in the background. One write runs at a time so an
+        older snapshot never lands after a newer one. The worker makes no
+        Tk calls; the Tk thread polls it (see _checksave).
+        """
+        self._save_after = None
+        if not self.store.dirty:
+            return
+        if self._save_thread and self._save_thread.is_alive():
+            self._save_after = self.after(SAVE_DELAY_MS, self._flush_store)
+            return
+        data = self.sys.tojson()
+        self.store.dirty = False
+        self._save_error = None
+        self._save_thread = threading.Thread(target=self._writestore, args=(data,))
+        self._save_thread.start()
+        self.after(SAVE_POLL_MS, self._checksave)
+
+    def _writestore(self, data: dict) -> None:
+        """Worker-thread body of _flush_store."""
+        try:
+            self.store.write(data)
+        except Exception as e:
+            self._save_error = e
+
+    def _checksave(self) -> None:
+        """Report the outcome of the background save once it has finished.
+
+        A failure leaves the store dirty, so the next change (see refresh)
+        or close() tries again. Only the first failure in a row is shown.
+        """
+        if self._save_thread and self._save_thread.is_alive():
+            self.after(SAVE_POLL_MS, self._checksave)
+            return
+        error, self._save_error = self._save_error, None
+        if error is None:
+            self._save_failing = False
+            return
+        self.store.dirty = True
+        if not self._save_failing:
+            self._save_failing = True
+            messagebox.showerror("Error", f"Could not save data: {error}")
+
+    def close(self) -> None:
+        """Finish any pending save, then close the window.
+
+        Saves once more on the Tk thread if anything was written in the
+        background, since the last write may have failed before _checksave
+        got to see it.
+        """
+        if self._save_after:
+            self.after_cancel(self._save_after)
+            self._save_after = None
+        if self._save_thread:
+            self._save_thread.join()  # the worker never waits on Tk
+        if self.store.dirty or self._save_thread:
+            try:
+                self.store.save()
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not save data: {e}")
+        self.master.destroy()
+
+    def _fill(self, tree: ttk.Treeview, rows: dict[str, tuple]) -> None:
+        """Bring a tree in line with ``rows`` (iid -> values).
+
+        Compares against the values shown last time: rows that are gone
+        are deleted in one call, new rows are inserted and only rows whose
+        values changed are updated, so unchanged rows cost no Tk calls.
+        New rows go to the end; the tree is reordered in one call only if
+        that does not match the order of ``rows``.
+        """
+        shown = self._shown.get(tree, {})
+        gone = shown.keys() - rows.keys()
+        if gone:
+            tree.delete(*gone)
+        added = []
+        for iid, values in rows.items():
+            old = shown.get(iid)
+            if old is None:
+                tree.insert("", "end", iid=iid, values=values)
+                added.append(iid)
+            elif old != values:
+                tree.item(iid, values=values)
+        if added and [iid for iid in shown if iid in rows] + added != list(rows):
+            tree.set_children("", *rows)
+        self._shown[tree] = rows
+
+    def _queuesearch(self) -> None:
+        """Run the search once typing pauses; keys that leave the text alone are ignored."""
+        if self._search_after:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        if self.q.get() == self._last_q:
+            return
+        self._search_after = self.after(SEARCH_DELAY_MS, self.dosearch)
+
     def dosearch(self) -> None:
         """Re-run search with the current query and fill the results grid."""
-        q = self.q.get()
-        rows = self.store.search(q)
-        for iid in self.t_search.get_children():
-            self.t_search.delete(iid)
-        for typ, name, code, info in rows:
-            self.t_search.insert("", "end", values=(typ, name, code, info))
+        if self._search_after:  # called directly (e.g. by refresh) while one is queued
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        q = self._last_q = self.q.get()
+        # ids are only unique per type, so the row iid carries both
+        self._fill(self.t_search, {f"{row[0]}:{row[2]}": row for row in self.store.search(q)})
 
 def main() -> None:
     """Create the Tk root and mount the app."""